@@ -7,6 +7,9 @@ improve the language design, identify issues, and suggest enhancements.
 """
 
 import json
+from collections import Counter
+from heapq import nlargest
+from operator import attrgetter
 from typing import List, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
@@ -20,7 +23,7 @@ class FeedbackType(Enum):
     PERFORMANCE_ISSUE = "performance_issue"
 
 
-@dataclass
+@dataclass(slots=True)
 class Feedback:
     """Represents feedback from a collaborating agent."""
     agent_id: str
@@ -103,32 +106,17 @@ class AgentCollaborator:
     
     def analyze_feedback_trends(self) -> Dict[str, Any]:
         """Analyze patterns in the feedback received."""
-        analysis = {
-            "total_feedback": len(self.feedback_items),
-            "by_type": {},
-            "by_priority": {},
-            "by_agent": {},
-            "top_priority_items": []
+        feedback_items = self.feedback_items
+        return {
+            "total_feedback": len(feedback_items),
+            "by_type": Counter(f.feedback_type.value for f in feedback_items),
+            "by_priority": Counter(f"priority_{f.priority}" for f in feedback_items),
+            "by_agent": Counter(f.agent_id for f in feedback_items),
+            # Top 3 of the high-priority items, highest first
+            "top_priority_items": nlargest(
+                3, (f for f in feedback_items if f.priority >= 4), key=attrgetter('priority')
+            ),
         }
-        
-        # Count by type
-        for feedback in self.feedback_items:
-            type_name = feedback.feedback_type.value
-            analysis["by_type"][type_name] = analysis["by_type"].get(type_name, 0) + 1
-            
-            # Count by priority
-            priority_str = f"priority_{feedback.priority}"
-            analysis["by_priority"][priority_str] = analysis["by_priority"].get(priority_str, 0) + 1
-            
-            # Count by agent
-            analysis["by_agent"][feedback.agent_id] = analysis["by_agent"].get(feedback.agent_id, 0) + 1
-        
-        # Get top priority items
-        high_priority = [f for f in self.feedback_items if f.priority >= 4]
-        high_priority.sort(key=lambda x: x.priority, reverse=True)
-        analysis["top_priority_items"] = high_priority[:3]  # Top 3
-        
-        return analysis
     
     def generate_resolution_plan(self) -> str:
         """Generate a plan to address the feedback."""
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Timing comparison of the Clarity execution engines.
+
+Runs a few loop- and call-heavy programs on the tree-walking Interpreter,
+the bytecode VM and, when it has been built, the compiled clarity_vm.VM,
+and prints the best of several runs for each. run_file uses whichever
+engine is fastest here.
+"""
+
+import time
+
+from clarity_interpreter import Interpreter, VM
+from clarity_parser import Lexer, Parser
+
+try:
+    from clarity_vm import VM as CompiledVM
+except ImportError:
+    CompiledVM = None
+
+ENGINES = [('Interpreter', Interpreter), ('VM', VM)]
+if CompiledVM is not None:
+    ENGINES.append(('clarity_vm.VM', CompiledVM))
+
+PROGRAMS = [
+    ("for + if", "var s = 0; for i in range(30000) { if i > 5 { s = s + i; } } s;"),
+    ("for", "var s = 0; for i in range(30000) { s = s + i; } s;"),
+    ("while + if", """
+    var s = 0;
+    var i = 0;
+    while i < 30000 {
+        if i > 5 { s = s + i; }
+        i = i + 1;
+    }
+    s;
+    """),
+    ("nested fn", """
+    fn outer(n: Int) -> Int {
+        fn inner(x: Int) -> Int { return x + 1; }
+        return inner(n);
+    }
+    var s = 0;
+    for i in range(3000) { s = s + outer(i); }
+    s;
+    """),
+    ("recursion", """
+    fn fib(n: Int, tag: String) -> Int {
+        if n < 2 { return n; }
+        return fib(n - 1, tag) + fib(n - 2, tag);
+    }
+    fib(16, "x");
+    """),
+]
+
+REPEATS = 5
+
+
+def best_time(engine_class, source):
+    """Best wall time over REPEATS runs, each on a freshly parsed AST."""
+    best = None
+    for _ in range(REPEATS):
+        ast = Parser(Lexer(source)).parse_program()
+        start = time.perf_counter()
+        engine_class().interpret(ast)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main():
+    print(f"{'program':<12}" + "".join(f"{name:>16}" for name, _ in ENGINES))
+    for label, source in PROGRAMS:
+        times = [best_time(engine_class, source) for _, engine_class in ENGINES]
+        print(f"{label:<12}" + "".join(f"{t:>15.3f}s" for t in times))
+
+
+if __name__ == "__main__":
+    main()
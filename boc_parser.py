@@ -5,58 +5,63 @@ and reason with each other.
 """
 
 import re
+import sys
 import json
-from enum import Enum
-from typing import List, Dict, Any, Optional, Union
+from bisect import bisect_right
+from enum import IntEnum
+from functools import lru_cache
+from typing import List, Any, NamedTuple
 
 
-class BOCTokenType(Enum):
+class BOCTokenType(IntEnum):
     # Literals
-    IDENTIFIER = "IDENTIFIER"
-    NUMBER = "NUMBER"
-    STRING = "STRING"
-    BOOLEAN = "BOOLEAN"
+    IDENTIFIER = 0
+    NUMBER = 1
+    STRING = 2
+    BOOLEAN = 3
     
     # Keywords
-    BELIEF = "BELIEF"
-    REASONING_CONTEXT = "REASONING_CONTEXT"
-    INTENT = "INTENT"
-    SHARED_STATE = "SHARED_STATE"
-    SELF_CAPABILITY = "SELF_CAPABILITY"
-    CALCULATE_WITH_UNCERTAINTY = "CALCULATE_WITH_UNCERTAINTY"
-    STRUCTURED_KNOWLEDGE = "STRUCTURED_KNOWLEDGE"
-    ENTITY = "ENTITY"
-    AT = "AT"
-    TIMESTAMP = "TIMESTAMP"
+    BELIEF = 4
+    REASONING_CONTEXT = 5
+    INTENT = 6
+    SHARED_STATE = 7
+    SELF_CAPABILITY = 8
+    CALCULATE_WITH_UNCERTAINTY = 9
+    STRUCTURED_KNOWLEDGE = 10
+    ENTITY = 11
+    AT = 12
+    TIMESTAMP = 13
     
     # Operators
-    ASSIGN = "ASSIGN"      # =
-    LAMBDA = "LAMBDA"      # =>
-    ACCESS = "ACCESS"      # .
-    RANGE = "RANGE"        # ..
+    ASSIGN = 14         # =
+    LAMBDA = 15         # =>
+    ACCESS = 16         # .
+    RANGE = 17          # ..
     
     # Delimiters
-    LBRACE = "LBRACE"       # {
-    RBRACE = "RBRACE"       # }
-    LBRACKET = "LBRACKET"   # [
-    RBRACKET = "RBRACKET"   # ]
-    LPAREN = "LPAREN"       # (
-    RPAREN = "RPAREN"       # )
-    COMMA = "COMMA"         # ,
-    COLON = "COLON"         # :
-    SEMICOLON = "SEMICOLON" # ;
+    LBRACE = 18         # {
+    RBRACE = 19         # }
+    LBRACKET = 20       # [
+    RBRACKET = 21       # ]
+    LPAREN = 22         # (
+    RPAREN = 23         # )
+    COMMA = 24          # ,
+    COLON = 25          # :
+    SEMICOLON = 26      # ;
     
     # Special
-    EOF = "EOF"
+    EOF = 27
 
 
 class BOCNode:
     """Base class for BOC AST nodes."""
-    pass
+    __slots__ = ()
+    node_type = 'BOCNode'
 
 
 class BOCToken:
     """Represents a lexical token in BOC."""
+    __slots__ = ('type', 'value', 'line', 'column')
     
     def __init__(self, type_: BOCTokenType, value: str, line: int, column: int):
         self.type = type_
@@ -68,183 +73,211 @@ class BOCToken:
         return f"BOCToken({self.type.name}, {self.value}, {self.line}:{self.column})"
 
 
+# One alternation for every token the lexer produces; the regex engine
+# finds each token's extent in C. Leading whitespace is part of the match,
+# so skipping it costs no extra scanner step. An '@' starts an identifier,
+# so AT is never produced on its own. Anything left unmatched is illegal.
+_TOKEN_RE = re.compile(r'''
+    \s*
+    (?:
+    (?P<NUMBER>\d[\d.]*)
+  | (?P<IDENTIFIER>(?:[^\W\d_]|@)[\w@-]*)
+  | (?P<STRING>"(?:\\.|[^"\\])*\\?(?P<DQUOTE_END>")?|'(?:\\.|[^'\\])*\\?(?P<SQUOTE_END>')?)
+  | (?P<RANGE>\.\.)
+  | (?P<LAMBDA>=>)
+  | (?P<PUNCT>[={}\[\](),:.;])
+    )
+''', re.VERBOSE | re.DOTALL)
+
+_IDENTIFIER_GROUP = _TOKEN_RE.groupindex['IDENTIFIER']
+_PUNCT_GROUP = _TOKEN_RE.groupindex['PUNCT']
+_STRING_GROUP = _TOKEN_RE.groupindex['STRING']
+_DQUOTE_END_GROUP = _TOKEN_RE.groupindex['DQUOTE_END']
+_SQUOTE_END_GROUP = _TOKEN_RE.groupindex['SQUOTE_END']
+
+_SPACE_RUN = re.compile(r'\s*')
+
+_NEWLINE_RE = re.compile('\n')
+
+# A backslash escapes the next character; a trailing one is dropped
+_ESCAPE_RE = re.compile(r'\\(.?)', re.DOTALL)
+
+# Keys are lower case; identifiers match them case-insensitively
+_BOC_KEYWORDS = {
+    'belief': BOCTokenType.BELIEF,
+    'reasoning_context': BOCTokenType.REASONING_CONTEXT,
+    'intent': BOCTokenType.INTENT,
+    'shared_state': BOCTokenType.SHARED_STATE,
+    'self_capability': BOCTokenType.SELF_CAPABILITY,
+    'calculate_with_uncertainty': BOCTokenType.CALCULATE_WITH_UNCERTAINTY,
+    'structured_knowledge': BOCTokenType.STRUCTURED_KNOWLEDGE,
+    'entity': BOCTokenType.ENTITY,
+    'true': BOCTokenType.BOOLEAN,
+    'false': BOCTokenType.BOOLEAN,
+}
+
+_PUNCT_TOKENS = {
+    '=': BOCTokenType.ASSIGN,
+    '{': BOCTokenType.LBRACE,
+    '}': BOCTokenType.RBRACE,
+    '[': BOCTokenType.LBRACKET,
+    ']': BOCTokenType.RBRACKET,
+    '(': BOCTokenType.LPAREN,
+    ')': BOCTokenType.RPAREN,
+    ',': BOCTokenType.COMMA,
+    ':': BOCTokenType.COLON,
+    '.': BOCTokenType.ACCESS,
+    ';': BOCTokenType.SEMICOLON,
+}
+
+# Token type for each _TOKEN_RE group whose type follows from the group
+# alone; identifiers, strings and punctuation depend on the matched text
+_GROUP_TOKEN_TYPES = [None] * (_TOKEN_RE.groups + 1)
+for _name in ('NUMBER', 'RANGE', 'LAMBDA'):
+    _GROUP_TOKEN_TYPES[_TOKEN_RE.groupindex[_name]] = BOCTokenType[_name]
+del _name
+
+
 class BOCLexer:
     """Lexical analyzer for Bot-Optimized Clarity."""
     
     def __init__(self, text: str):
         self.text = text
-        self.pos = 0
-        self.current_char = self.text[self.pos] if self.text else None
+        # Offsets of every newline, so a token's line/column is a bisect away
+        self._newlines = [match.start() for match in _NEWLINE_RE.finditer(text)]
         self.line = 1
         self.column = 0
-        
-    def advance(self):
-        """Move to the next character."""
-        if self.current_char == '\n':
-            self.line += 1
-            self.column = 0
-        else:
-            self.column += 1
-            
-        self.pos += 1
-        if self.pos >= len(self.text):
-            self.current_char = None
-        else:
-            self.current_char = self.text[self.pos]
-    
-    def peek(self) -> Optional[str]:
-        """Look at the next character without advancing position."""
-        peek_pos = self.pos + 1
-        if peek_pos >= len(self.text):
-            return None
-        return self.text[peek_pos]
-    
-    def skip_whitespace(self):
-        """Skip over whitespace characters."""
-        while self.current_char is not None and self.current_char.isspace():
-            self.advance()
-    
-    def read_number(self) -> str:
-        """Read a number token."""
-        result = ''
-        while self.current_char is not None and (self.current_char.isdigit() or self.current_char == '.'):
-            result += self.current_char
-            self.advance()
-        return result
-    
-    def read_identifier(self) -> str:
-        """Read an identifier token."""
-        result = ''
-        while self.current_char is not None and (self.current_char.isalnum() or self.current_char in ['_', '-', '@']):
-            result += self.current_char
-            self.advance()
-        return result
-    
-    def read_string(self) -> str:
-        """Read a string literal."""
-        result = ''
-        quote_char = self.current_char  # Store opening quote
-        self.advance()  # Skip opening quote
-        
-        while self.current_char is not None and self.current_char != quote_char:
-            if self.current_char == '\\':  # Handle escape sequences
-                self.advance()
-                if self.current_char is not None:
-                    result += self.current_char
-                    self.advance()
+        self._tokens = self._tokenize()
+    
+    def _locate(self, offset: int):
+        """Return the (line, column) of a character offset."""
+        row = bisect_right(self._newlines, offset)
+        if row:
+            return row + 1, offset - self._newlines[row - 1] - 1
+        return 1, offset
+    
+    def _tokenize(self):
+        """Generate the tokens of the input, ending with EOF."""
+        text = self.text
+        keywords = _BOC_KEYWORDS
+        group_types = _GROUP_TOKEN_TYPES
+        identifier = BOCTokenType.IDENTIFIER
+        # The scanner matches token after token from where the previous one
+        # ended, so the position bookkeeping stays inside the regex engine
+        next_match = _TOKEN_RE.scanner(text).match
+        pos = 0
+        for match in iter(next_match, None):
+            # lastindex is the number of the group that matched (an outer
+            # group closes after the ones nested in it); compared as an
+            # int rather than by lastgroup's name
+            kind = match.lastindex
+            start, pos = match.span(kind)
+            value = match.group(kind)
+            if kind == _IDENTIFIER_GROUP:
+                value = sys.intern(value)
+                token_type = keywords.get(value)
+                if token_type is None:
+                    # Keywords are case-insensitive, but most identifiers are
+                    # already lower case and need no second lookup
+                    token_type = identifier if value.islower() else keywords.get(value.lower(), identifier)
+            elif kind == _PUNCT_GROUP:
+                token_type = _PUNCT_TOKENS[value]
+            elif kind == _STRING_GROUP:
+                # An unterminated string has no closing quote to strip, even
+                # when it ends in an escaped one
+                closed = match.group(_DQUOTE_END_GROUP) or match.group(_SQUOTE_END_GROUP)
+                body = value[1:-1] if closed else value[1:]
+                if '\\' in body:
+                    body = _ESCAPE_RE.sub(r'\1', body)
+                value = sys.intern(body)
+                token_type = BOCTokenType.STRING
             else:
-                result += self.current_char
-                self.advance()
+                token_type = group_types[kind]
+            yield BOCToken(token_type, value, *self._locate(start))
         
-        if self.current_char == quote_char:
-            self.advance()  # Skip closing quote
+        # Trailing whitespace has no token to attach to
+        pos = _SPACE_RUN.match(text, pos).end()
+        if pos < len(text):
+            # The scanner stopped on a character no token starts with
+            self.line, self.column = self._locate(pos)
+            raise Exception(f"Illegal character '{text[pos]}' at {self.line}:{self.column}")
         
-        return result
+        self.line, self.column = self._locate(pos)
+        yield BOCToken(BOCTokenType.EOF, '', self.line, self.column)
+    
+    def tokenize(self) -> List[BOCToken]:
+        """Return all remaining tokens, ending with EOF."""
+        return list(self._tokens)
     
     def get_next_token(self) -> BOCToken:
         """Get the next token from the input."""
-        while self.current_char is not None:
-            if self.current_char.isspace():
-                self.skip_whitespace()
-                continue
-            
-            if self.current_char.isdigit():
-                start_line, start_col = self.line, self.column
-                value = self.read_number()
-                return BOCToken(BOCTokenType.NUMBER, value, start_line, start_col)
-            
-            if self.current_char.isalpha() or self.current_char == '@':
-                start_line, start_col = self.line, self.column
-                value = self.read_identifier()
-                
-                # Check if it's a keyword
-                keyword_map = {
-                    'belief': BOCTokenType.BELIEF,
-                    'reasoning_context': BOCTokenType.REASONING_CONTEXT,
-                    'intent': BOCTokenType.INTENT,
-                    'shared_state': BOCTokenType.SHARED_STATE,
-                    'self_capability': BOCTokenType.SELF_CAPABILITY,
-                    'calculate_with_uncertainty': BOCTokenType.CALCULATE_WITH_UNCERTAINTY,
-                    'structured_knowledge': BOCTokenType.STRUCTURED_KNOWLEDGE,
-                    'entity': BOCTokenType.ENTITY,
-                    'true': BOCTokenType.BOOLEAN,
-                    'false': BOCTokenType.BOOLEAN,
-                }
-                
-                token_type = keyword_map.get(value.lower(), BOCTokenType.IDENTIFIER)
-                return BOCToken(token_type, value, start_line, start_col)
-            
-            if self.current_char in ['"', "'"]:
-                start_line, start_col = self.line, self.column
-                value = self.read_string()
-                return BOCToken(BOCTokenType.STRING, value, start_line, start_col)
-            
-            # Multi-character operators
-            if self.current_char == '.' and self.peek() == '.':
-                self.advance()
-                self.advance()
-                return BOCToken(BOCTokenType.RANGE, '..', self.line, self.column - 1)
-            
-            if self.current_char == '=' and self.peek() == '>':
-                self.advance()
-                self.advance()
-                return BOCToken(BOCTokenType.LAMBDA, '=>', self.line, self.column - 1)
-            
-            # Single character tokens
-            char_tokens = {
-                '=': BOCTokenType.ASSIGN,
-                '{': BOCTokenType.LBRACE,
-                '}': BOCTokenType.RBRACE,
-                '[': BOCTokenType.LBRACKET,
-                ']': BOCTokenType.RBRACKET,
-                '(': BOCTokenType.LPAREN,
-                ')': BOCTokenType.RPAREN,
-                ',': BOCTokenType.COMMA,
-                ':': BOCTokenType.COLON,
-                '.': BOCTokenType.ACCESS,
-                ';': BOCTokenType.SEMICOLON,
-                '@': BOCTokenType.AT,
-            }
-            
-            if self.current_char in char_tokens:
-                char = self.current_char
-                start_line, start_col = self.line, self.column
-                self.advance()
-                return BOCToken(char_tokens[char], char, start_line, start_col)
-            
-            # Unknown character
-            raise Exception(f"Illegal character '{self.current_char}' at {self.line}:{self.column}")
-        
-        return BOCToken(BOCTokenType.EOF, '', self.line, self.column)
+        token = next(self._tokens, None)
+        if token is None:
+            # Past the end the lexer keeps returning EOF
+            return BOCToken(BOCTokenType.EOF, '', self.line, self.column)
+        return token
 
 
 class BOCBelief(BOCNode):
+    __slots__ = ('attributes', 'content')
+    node_type = 'BOCBelief'
+    
     def __init__(self, attributes, content):
         self.attributes = attributes  # dict of attribute_name -> value
         self.content = content        # list of statements/content
-        self.node_type = 'BOCBelief'
 
 
 class BOCReasoningContext(BOCNode):
+    __slots__ = ('attributes', 'content')
+    node_type = 'BOCReasoningContext'
+    
     def __init__(self, attributes, content):
         self.attributes = attributes
         self.content = content
-        self.node_type = 'BOCReasoningContext'
 
 
 class BOCIntent(BOCNode):
+    __slots__ = ('action', 'attributes', 'content')
+    node_type = 'BOCIntent'
+    
     def __init__(self, action, attributes, content):
         self.action = action
         self.attributes = attributes
         self.content = content
-        self.node_type = 'BOCIntent'
 
 
 class BOCStructuredKnowledge(BOCNode):
+    __slots__ = ('attributes', 'content')
+    node_type = 'BOCStructuredKnowledge'
+    
     def __init__(self, attributes, content):
         self.attributes = attributes
         self.content = content
-        self.node_type = 'BOCStructuredKnowledge'
+
+
+# Expression-level nodes are small and numerous, so they are named tuples
+# rather than dicts; node_type matches the 'type' tag statements carry
+
+class BOCLiteral(NamedTuple):
+    value: str
+    token_type: str
+    node_type = 'Literal'
+
+
+class BOCIdentifier(NamedTuple):
+    value: str
+    node_type = 'Identifier'
+
+
+class BOCArray(NamedTuple):
+    items: list
+    node_type = 'Array'
+
+
+class BOCKeyValue(NamedTuple):
+    key: str
+    value: Any
+    node_type = 'KeyValue'
 
 
 class BOCParser:
@@ -252,15 +285,25 @@ class BOCParser:
     
     def __init__(self, lexer: BOCLexer):
         self.lexer = lexer
-        self.current_token = self.lexer.get_next_token()
+        # Lex everything up front and walk the list by index, so consuming
+        # a token is an increment rather than a trip through the generator
+        self.tokens = lexer.tokenize()
+        self.index = 0
+        self.current_token = self.tokens[0]
     
     def eat(self, token_type: BOCTokenType):
         """Consume a token of the expected type."""
         if self.current_token.type == token_type:
-            self.current_token = self.lexer.get_next_token()
+            self.index += 1
+            self.current_token = self.tokens[self.index]
         else:
             raise Exception(f"Expected token {token_type.name}, got {self.current_token.type.name}")
     
+    def _advance(self):
+        """Consume the current token, whose type the caller has already checked."""
+        self.index += 1
+        self.current_token = self.tokens[self.index]
+    
     def parse_program(self):
         """Parse the entire program."""
         statements = []
@@ -273,25 +316,10 @@ class BOCParser:
     def parse_statement(self):
         """Parse a single statement."""
         token_type = self.current_token.type
-        
-        if token_type == BOCTokenType.BELIEF:
-            return self.parse_belief()
-        elif token_type == BOCTokenType.REASONING_CONTEXT:
-            return self.parse_reasoning_context()
-        elif token_type == BOCTokenType.INTENT:
-            return self.parse_intent()
-        elif token_type == BOCTokenType.SHARED_STATE:
-            return self.parse_shared_state()
-        elif token_type == BOCTokenType.SELF_CAPABILITY:
-            return self.parse_self_capability()
-        elif token_type == BOCTokenType.CALCULATE_WITH_UNCERTAINTY:
-            return self.parse_calculate_with_uncertainty()
-        elif token_type == BOCTokenType.STRUCTURED_KNOWLEDGE:
-            return self.parse_structured_knowledge()
-        elif token_type == BOCTokenType.IDENTIFIER:
-            return self.parse_assignment()
-        else:
+        handler = _STATEMENT_PARSERS.get(token_type)
+        if handler is None:
             raise Exception(f"Unexpected statement starting with {token_type.name}")
+        return handler(self)
     
     def parse_shared_state(self):
         """Parse a shared state statement."""
@@ -316,22 +344,23 @@ class BOCParser:
     
     def parse_attributes(self):
         """Parse attribute list like @attr1(...) @attr2(...)"""
-        attributes = {}
+        # Collect (name, value) pairs and build the dict once at the end
+        attributes = []
         while self.current_token.type == BOCTokenType.AT:
-            self.eat(BOCTokenType.AT)
+            self._advance()
             attr_name = self.current_token.value
             self.eat(BOCTokenType.IDENTIFIER)
             
             if self.current_token.type == BOCTokenType.LPAREN:
-                self.eat(BOCTokenType.LPAREN)
+                self._advance()
                 attr_value = self.parse_expression()
                 self.eat(BOCTokenType.RPAREN)
             else:
                 attr_value = True  # Attribute without value is treated as true
                 
-            attributes[attr_name] = attr_value
+            attributes.append((attr_name, attr_value))
         
-        return attributes
+        return dict(attributes)
     
     def parse_block_content(self):
         """Parse content inside braces { ... }"""
@@ -345,7 +374,7 @@ class BOCParser:
                 self.eat(BOCTokenType.IDENTIFIER)
                 self.eat(BOCTokenType.COLON)
                 value = self.parse_expression()
-                content.append({'type': 'KeyValue', 'key': key, 'value': value})
+                content.append(BOCKeyValue(key, value))
             elif self.current_token.type == BOCTokenType.RBRACE:
                 break
             else:
@@ -412,52 +441,87 @@ class BOCParser:
         return {'type': 'Assignment', 'key': key, 'value': value}
     
     def parse_expression(self):
-        """Parse an expression."""
-        # Handle array expressions first
-        if self.current_token.type == BOCTokenType.LBRACKET:
-            return self.parse_array()
-        
-        # For now, just handle basic expressions
-        if self.current_token.type in [BOCTokenType.STRING, BOCTokenType.NUMBER, BOCTokenType.BOOLEAN]:
-            value = self.current_token.value
-            token_type = self.current_token.type
-            self.eat(token_type)
-            return {'type': 'Literal', 'value': value, 'token_type': token_type.name}
-        elif self.current_token.type == BOCTokenType.IDENTIFIER:
-            value = self.current_token.value
-            self.eat(BOCTokenType.IDENTIFIER)
-            return {'type': 'Identifier', 'value': value}
-        else:
-            raise Exception(f"Unexpected token in expression: {self.current_token.type.name}")
-    
-    def parse_array(self):
-        """Parse an array expression [item1, item2, ...]"""
-        self.eat(BOCTokenType.LBRACKET)
-        items = []
-        
-        if self.current_token.type != BOCTokenType.RBRACKET:
-            while True:
-                item = self.parse_expression()
-                items.append(item)
-                
+        """Parse an expression.
+
+        Arrays nest to any depth; the item lists of the arrays still open
+        are kept on an explicit stack instead of recursing per level.
+        """
+        open_arrays = []
+        while True:
+            token = self.current_token
+            if token.type == BOCTokenType.LBRACKET:
+                self._advance()
+                if self.current_token.type != BOCTokenType.RBRACKET:
+                    open_arrays.append([])
+                    continue
+                self._advance()
+                expr = BOCArray([])
+            elif token.type in _LITERAL_TOKENS:
+                self._advance()
+                expr = BOCLiteral(token.value, token.type.name)
+            elif token.type == BOCTokenType.IDENTIFIER:
+                self._advance()
+                expr = BOCIdentifier(token.value)
+            else:
+                raise Exception(f"Unexpected token in expression: {token.type.name}")
+            
+            # Hand the finished expression to the innermost open array,
+            # closing every array that ends right after it
+            while open_arrays:
+                items = open_arrays[-1]
+                items.append(expr)
                 if self.current_token.type == BOCTokenType.RBRACKET:
-                    break
+                    self._advance()
+                    open_arrays.pop()
+                    expr = BOCArray(items)
                 elif self.current_token.type == BOCTokenType.COMMA:
-                    self.eat(BOCTokenType.COMMA)
+                    self._advance()
+                    break
                 else:
                     raise Exception(f"Expected comma or closing bracket, got {self.current_token.type.name}")
-        
-        self.eat(BOCTokenType.RBRACKET)
-        return {'type': 'Array', 'items': items}
+            else:
+                return expr
+
 
+_LITERAL_TOKENS = frozenset({BOCTokenType.STRING, BOCTokenType.NUMBER, BOCTokenType.BOOLEAN})
 
+_STATEMENT_PARSERS = {
+    BOCTokenType.BELIEF: BOCParser.parse_belief,
+    BOCTokenType.REASONING_CONTEXT: BOCParser.parse_reasoning_context,
+    BOCTokenType.INTENT: BOCParser.parse_intent,
+    BOCTokenType.SHARED_STATE: BOCParser.parse_shared_state,
+    BOCTokenType.SELF_CAPABILITY: BOCParser.parse_self_capability,
+    BOCTokenType.CALCULATE_WITH_UNCERTAINTY: BOCParser.parse_calculate_with_uncertainty,
+    BOCTokenType.STRUCTURED_KNOWLEDGE: BOCParser.parse_structured_knowledge,
+    BOCTokenType.IDENTIFIER: BOCParser.parse_assignment,
+}
+
+@lru_cache(maxsize=256)
 def parse_boc_code(code: str):
-    """Parse BOC code and return the AST."""
+    """Parse BOC code and return the AST.
+
+    Results are cached per source string, so repeated calls return the
+    same AST object; copy it before modifying.
+    """
     lexer = BOCLexer(code)
     parser = BOCParser(lexer)
     return parser.parse_program()
 
 
+def _to_json_tree(node):
+    """Expand expression tuples into dicts tagged with their node type."""
+    if isinstance(node, dict):
+        return {key: _to_json_tree(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_to_json_tree(item) for item in node]
+    if isinstance(node, tuple) and hasattr(node, 'node_type'):
+        tree = {'type': node.node_type}
+        for field, value in zip(node._fields, node):
+            tree[field] = _to_json_tree(value)
+        return tree
+    return node
+
+
 def main():
     """Test the BOC parser with sample code."""
     sample_boc_code = """
@@ -481,7 +545,7 @@ def main():
     try:
         ast = parse_boc_code(sample_boc_code)
         print("\nParsed AST:")
-        print(json.dumps(ast, indent=2, default=str))
+        print(json.dumps(_to_json_tree(ast), indent=2, default=str))
     except Exception as e:
         print(f"\nParse error: {e}")
         import traceback
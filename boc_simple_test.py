@@ -3,7 +3,7 @@
 Simple test of the Bot-Optimized Clarity (BOC) language concepts.
 """
 
-from boc_parser import parse_boc_code
+from boc_parser import BOCLexer, BOCTokenType, parse_boc_code
 import json
 
 def test_simple_boc():
@@ -53,6 +53,28 @@ def test_simple_boc():
         return False
 
 
+def test_string_lexing():
+    """Test that string tokens keep escaped quotes, terminated or not."""
+    
+    cases = [
+        ('"abc"', 'abc'),
+        ("'abc'", 'abc'),
+        ('"say \\"hi\\""', 'say "hi"'),
+        # Unterminated strings ending in an escaped quote keep that quote
+        ('"abc\\"', 'abc"'),
+        ("'x\\'", "x'"),
+    ]
+    
+    print("\nString lexing:")
+    passed = True
+    for source, expected in cases:
+        token = BOCLexer(source).get_next_token()
+        ok = token.type == BOCTokenType.STRING and token.value == expected
+        passed = passed and ok
+        print(f"  {'✓' if ok else '✗'} {source} -> {token.value!r}")
+    return passed
+
+
 def describe_evolution():
     """Describe the evolution from human-focused to bot-focused language."""
     
@@ -97,6 +119,7 @@ between AI agents.
 
 if __name__ == "__main__":
     success = test_simple_boc()
+    success = test_string_lexing() and success
     describe_evolution()
     
     if success:
@@ -5,7 +5,10 @@ This provides runtime execution of parsed Clarity programs.
 """
 
 from clarity_parser import *
+from functools import lru_cache
 import math
+import operator
+import sys
 
 
 class Environment:
@@ -33,6 +36,436 @@ class Environment:
             return self.parent.get(name)
         else:
             raise NameError(f"Undefined variable: {name}")
+    
+    def get_at(self, depth, name):
+        """Read a binding the Resolver placed ``depth`` scopes up."""
+        env = self
+        while depth:
+            env = env.parent
+            depth -= 1
+        return env.vars[name]
+    
+    def assign_at(self, depth, name, value):
+        """Rebind a variable the Resolver placed ``depth`` scopes up."""
+        env = self
+        while depth:
+            env = env.parent
+            depth -= 1
+        env.vars[name] = value
+
+
+# Data the interpreter precomputes per AST node lives in the node's
+# ``_cache`` slot, whose meaning depends on the node type:
+#   Identifier, Assignment, FunctionCall  scope depth, set by Resolver
+#   BinaryOp, UnaryOp                     operator function
+#   WhileLoop                             compiled loop (see _compile_loop)
+#   FunctionDef                           _FunctionInfo (see _prepare_function)
+# A tree visited without interpret() has no depths; the Interpreter then
+# looks every name up through the environment chain.
+
+
+class Resolver:
+    """Annotates name references with how many scopes up they are bound.
+
+    Calls run in an environment whose parent is the caller's, so only
+    names declared in the same function body (or at program level)
+    resolve statically. Everything else gets depth None and is looked
+    up through the environment chain at runtime.
+    """
+
+    def __init__(self):
+        self.scopes = [set()]
+
+    def resolve(self, node):
+        resolver = getattr(self, f'resolve_{node.node_type}', None)
+        if resolver is not None:
+            resolver(node)
+
+    def _lookup(self, name):
+        scopes = self.scopes
+        for depth in range(len(scopes)):
+            if name in scopes[-1 - depth]:
+                return depth
+        return None
+
+    def _resolve_block(self, statements, names=()):
+        self.scopes.append(set(names))
+        for stmt in statements:
+            self.resolve(stmt)
+        self.scopes.pop()
+
+    def resolve_Program(self, node):
+        for stmt in node.statements:
+            self.resolve(stmt)
+
+    def resolve_FunctionDef(self, node):
+        self.scopes[-1].add(node.name)
+        outer_scopes = self.scopes
+        self.scopes = [{param[0] for param in node.params}]
+        for stmt in node.body:
+            self.resolve(stmt)
+        self.scopes = outer_scopes
+
+    def resolve_VariableDecl(self, node):
+        self.resolve(node.value)
+        self.scopes[-1].add(node.name)
+
+    resolve_ConstantDecl = resolve_VariableDecl
+
+    def resolve_Assignment(self, node):
+        self.resolve(node.value)
+        node._cache = self._lookup(node.name)
+
+    def resolve_BinaryOp(self, node):
+        self.resolve(node.left)
+        self.resolve(node.right)
+
+    def resolve_UnaryOp(self, node):
+        self.resolve(node.operand)
+
+    def resolve_IfExpr(self, node):
+        self.resolve(node.condition)
+        self._resolve_block(node.then_branch)
+        if node.else_branch:
+            self._resolve_block(node.else_branch)
+
+    def resolve_WhileLoop(self, node):
+        # The condition runs inside the (freshly cleared) loop scope
+        self.scopes.append(set())
+        self.resolve(node.condition)
+        for stmt in node.body:
+            self.resolve(stmt)
+        self.scopes.pop()
+
+    def resolve_ForLoop(self, node):
+        self.resolve(node.iterable)
+        self._resolve_block(node.body, (node.variable,))
+
+    def resolve_ReturnStmt(self, node):
+        if node.value:
+            self.resolve(node.value)
+
+    def resolve_FunctionCall(self, node):
+        node._cache = self._lookup(node.name)
+        for arg in node.args:
+            self.resolve(arg)
+
+    def resolve_Identifier(self, node):
+        node._cache = self._lookup(node.name)
+
+    def resolve_MatchExpr(self, node):
+        # Patterns are literals or catch-alls, never references
+        self.resolve(node.expr)
+        for _, result_expr in node.arms:
+            self.resolve(result_expr)
+
+
+class _ReturnSignal(Exception):
+    """Unwinds a function body when a return statement executes."""
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class _NotJittable(Exception):
+    """Raised when a function body falls outside the transpilable subset."""
+
+
+def _safe_div(left, right):
+    if right == 0:
+        raise ZeroDivisionError("Division by zero")
+    return left / right
+
+
+_BINOPS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': _safe_div,
+    '%': operator.mod,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '>': operator.gt,
+    '<=': operator.le,
+    '>=': operator.ge,
+}
+
+_UNARYOPS = {
+    '-': operator.neg,
+    '!': operator.not_,
+}
+
+_JIT_PARAM_TYPES = ('Int', 'Float')
+
+_JIT_OPERATORS = {
+    '+': '+', '-': '-', '*': '*', '%': '%',
+    '==': '==', '!=': '!=', '<': '<', '>': '>', '<=': '<=', '>=': '>=',
+    '&&': 'and', '||': 'or',
+}
+
+
+class _JitEmitter:
+    """Emits Python source for a numeric-only Clarity function.
+
+    Only functions whose bodies use arithmetic, comparisons, if/while,
+    returns, literals, their own locals and calls to themselves qualify.
+    The generated code reproduces the interpreter's statement-value
+    semantics, so a function returns its last statement's value unless a
+    return statement ends it first.
+    """
+
+    def __init__(self, func_def):
+        self.func_def = func_def
+        self.lines = []
+        self.names = set()
+
+    def emit(self):
+        func_def = self.func_def
+        for param_name, param_type in func_def.params:
+            if param_type not in _JIT_PARAM_TYPES:
+                raise _NotJittable(param_name)
+            self.names.add(param_name)
+        params = ', '.join(f'v_{name}' for name, _ in func_def.params)
+        self.lines.append(f'def _jit_fn({params}):')
+
+        body = func_def.body
+        for i, stmt in enumerate(body):
+            if isinstance(stmt, ReturnStmt):
+                self.lines.append(f'    return {self._value(stmt.value)}')
+                break
+            self._stmt(stmt, 1, want=i == len(body) - 1, top_level=True)
+        else:
+            self.lines.append('    return _v' if body else '    return None')
+        return '\n'.join(self.lines)
+
+    def _stmt(self, stmt, depth, want, top_level=False):
+        pad = '    ' * depth
+        target = '_v = ' if want else ''
+        if isinstance(stmt, (VariableDecl, ConstantDecl)):
+            # Block-scoped declarations would shadow; keep them top-level only
+            if not top_level:
+                raise _NotJittable(stmt.name)
+            value = self._expr(stmt.value)
+            self.names.add(stmt.name)
+            self.lines.append(f'{pad}v_{stmt.name} = {value}')
+            if want:
+                self.lines.append(f'{pad}_v = v_{stmt.name}')
+        elif isinstance(stmt, Assignment):
+            if stmt.name not in self.names:
+                raise _NotJittable(stmt.name)
+            self.lines.append(f'{pad}v_{stmt.name} = {self._expr(stmt.value)}')
+            if want:
+                self.lines.append(f'{pad}_v = v_{stmt.name}')
+        elif isinstance(stmt, ReturnStmt):
+            self.lines.append(f'{pad}return {self._value(stmt.value)}')
+        elif isinstance(stmt, IfExpr):
+            self.lines.append(f'{pad}if {self._expr(stmt.condition)}:')
+            self._block(stmt.then_branch, depth + 1, want)
+            if stmt.else_branch:
+                self.lines.append(f'{pad}else:')
+                self._block(stmt.else_branch, depth + 1, want)
+            elif want:
+                self.lines.append(f'{pad}else:')
+                self.lines.append(f'{pad}    _v = None')
+        elif isinstance(stmt, WhileLoop):
+            if want:
+                self.lines.append(f'{pad}_v = None')
+            self.lines.append(f'{pad}while {self._expr(stmt.condition)}:')
+            self._block(stmt.body, depth + 1, want, empty_value=False)
+        else:
+            self.lines.append(f'{pad}{target}{self._expr(stmt)}')
+
+    def _block(self, statements, depth, want, empty_value=True):
+        if not statements:
+            pad = '    ' * depth
+            self.lines.append(f'{pad}_v = None' if want and empty_value else f'{pad}pass')
+            return
+        for i, stmt in enumerate(statements):
+            self._stmt(stmt, depth, want and i == len(statements) - 1)
+
+    def _value(self, expr):
+        return 'None' if expr is None else self._expr(expr)
+
+    def _expr(self, node):
+        if isinstance(node, BinaryOp):
+            left = self._expr(node.left)
+            right = self._expr(node.right)
+            if node.operator == '/':
+                return f'_safe_div({left}, {right})'
+            operator = _JIT_OPERATORS.get(node.operator)
+            if operator is None:
+                raise _NotJittable(node.operator)
+            return f'({left} {operator} {right})'
+        if isinstance(node, UnaryOp):
+            if node.operator == '-':
+                return f'(-{self._expr(node.operand)})'
+            if node.operator == '!':
+                return f'(not {self._expr(node.operand)})'
+            raise _NotJittable(node.operator)
+        if isinstance(node, (Number, Boolean)):
+            return repr(node.value)
+        if isinstance(node, Identifier):
+            if node.name not in self.names:
+                raise _NotJittable(node.name)
+            return f'v_{node.name}'
+        if isinstance(node, FunctionCall):
+            if node.name != self.func_def.name or len(node.args) != len(self.func_def.params):
+                raise _NotJittable(node.name)
+            args = ', '.join(self._expr(arg) for arg in node.args)
+            return f'_jit_fn({args})'
+        raise _NotJittable(node.node_type)
+
+
+def _try_jit(func_def):
+    """Transpile a numeric-only function into a Python closure.
+
+    Returns None when the function uses anything outside the supported
+    subset, in which case callers fall back to normal evaluation.
+    """
+    try:
+        source = _JitEmitter(func_def).emit()
+    except _NotJittable:
+        return None
+    namespace = {'_safe_div': _safe_div}
+    exec(source, namespace)
+    return namespace['_jit_fn']
+
+
+class _FunctionInfo:
+    """The per-definition data every call to a user function needs."""
+    __slots__ = ('param_names', 'arity', 'jit', 'code')
+
+    def __init__(self, func_def):
+        self.param_names = tuple(param[0] for param in func_def.params)
+        self.arity = len(self.param_names)
+        self.jit = _try_jit(func_def)
+        self.code = None  # (code, consts) once compiled for the VM
+
+
+def _prepare_function(func_def):
+    """Return the _FunctionInfo for func_def, building it on first use.
+
+    The data depends only on the definition, so it is cached on the node:
+    a function declared inside another is not re-transpiled each time the
+    outer function runs.
+    """
+    try:
+        return func_def._cache
+    except AttributeError:
+        info = func_def._cache = _FunctionInfo(func_def)
+        return info
+
+
+class _LoopEmitter:
+    """Emits Python source for a while loop whose body only assigns.
+
+    A loop qualifies when its condition and statements use nothing but
+    operators, literals, variable reads and assignments. With no calls or
+    declarations inside, every name stays bound in the same environment
+    for the whole loop, so the generated function keeps the values in
+    Python locals and writes the assigned ones back when it finishes.
+    """
+
+    def __init__(self, node):
+        self.node = node
+        self.names = []
+        self.assigned = []
+
+    def emit(self):
+        body = []
+        condition = self._expr(self.node.condition)
+        for i, stmt in enumerate(self.node.body):
+            last = i == len(self.node.body) - 1
+            if isinstance(stmt, Assignment):
+                body.append(f'        v_{stmt.name} = {self._expr(stmt.value)}')
+                self._name(stmt.name)
+                if stmt.name not in self.assigned:
+                    self.assigned.append(stmt.name)
+                if last:
+                    body.append(f'        _v = v_{stmt.name}')
+            else:
+                # Expression statements can still raise, so keep them
+                target = '_v = ' if last else ''
+                body.append(f'        {target}{self._expr(stmt)}')
+        if not body:
+            body.append('        pass')
+
+        scopes = ', '.join(f's_{name}' for name in self.names)
+        lines = [f'def _loop_fn({scopes}):']
+        lines += [f'    v_{name} = s_{name}[{name!r}]' for name in self.names]
+        lines += ['    _v = None', '    try:', f'        while {condition}:']
+        lines += ['    ' + line for line in body]
+        lines.append('    finally:')
+        lines += [f'        s_{name}[{name!r}] = v_{name}' for name in self.assigned]
+        if not self.assigned:
+            lines.append('        pass')
+        lines.append('    return _v')
+        return '\n'.join(lines)
+
+    def _name(self, name):
+        if name not in self.names:
+            self.names.append(name)
+        return f'v_{name}'
+
+    def _expr(self, node):
+        if isinstance(node, BinaryOp):
+            left = self._expr(node.left)
+            right = self._expr(node.right)
+            if node.operator == '/':
+                return f'_safe_div({left}, {right})'
+            operator = _JIT_OPERATORS.get(node.operator)
+            if operator is None:
+                raise _NotJittable(node.operator)
+            return f'({left} {operator} {right})'
+        if isinstance(node, UnaryOp):
+            if node.operator == '-':
+                return f'(-{self._expr(node.operand)})'
+            if node.operator == '!':
+                return f'(not {self._expr(node.operand)})'
+            raise _NotJittable(node.operator)
+        if isinstance(node, (Number, Boolean, String)):
+            return repr(node.value)
+        if isinstance(node, Identifier):
+            return self._name(node.name)
+        raise _NotJittable(node.node_type)
+
+
+def _compile_loop(node):
+    """Return ``(loop_fn, names)`` for a qualifying while loop, else None.
+
+    The result is cached on the node. ``loop_fn`` takes, for each name in
+    ``names``, the ``vars`` dict of the environment binding it, and
+    returns the loop's value.
+    """
+    try:
+        return node._cache
+    except AttributeError:
+        pass
+    emitter = _LoopEmitter(node)
+    try:
+        source = emitter.emit()
+    except _NotJittable:
+        node._cache = None
+        return None
+    namespace = {'_safe_div': _safe_div}
+    exec(source, namespace)
+    node._cache = (namespace['_loop_fn'], tuple(emitter.names))
+    return node._cache
+
+
+def _loop_scopes(env, names):
+    """Find the vars dict binding each name, or None if one is unbound."""
+    scopes = []
+    for name in names:
+        scope = env
+        while scope is not None and name not in scope.vars:
+            scope = scope.parent
+        if scope is None:
+            return None
+        scopes.append(scope.vars)
+    return scopes
 
 
 class Interpreter:
@@ -43,6 +476,15 @@ class Interpreter:
         # Pre-populate with built-in functions
         self.global_env.define('println', self._builtin_println)
         self.global_env.define('sqrt', self._builtin_sqrt)
+        self.global_env.define('range', self._builtin_range)
+        # Scopes are restored inline rather than with try/finally; after an
+        # error, interpret() resets to this root environment instead
+        self._root_env = self.global_env
+        # Resolve visitor methods once instead of per node
+        self._visitors = {
+            name[len('visit_'):]: getattr(self, name)
+            for name in dir(self) if name.startswith('visit_')
+        }
     
     def _builtin_println(self, *args):
         """Built-in println function."""
@@ -53,15 +495,24 @@ class Interpreter:
         """Built-in square root function."""
         return math.sqrt(value)
     
+    def _builtin_range(self, *args):
+        """Built-in range function; for-loops iterate it without a list."""
+        return range(*args)
+    
     def visit_Program(self, node):
         """Execute a program (sequence of statements)."""
         result = None
-        for stmt in node.statements:
-            result = self.visit(stmt)
+        try:
+            for stmt in node.statements:
+                result = self.visit(stmt)
+        except _ReturnSignal as signal:
+            # A return outside any function ends the program
+            return signal.value
         return result
     
     def visit_FunctionDef(self, node):
         """Define a function in the environment."""
+        _prepare_function(node)
         self.global_env.define(node.name, node)
         return None
     
@@ -85,128 +536,110 @@ class Interpreter:
     def visit_Assignment(self, node):
         """Execute an assignment."""
         value = self.visit(node.value)
-        self.global_env.assign(node.name, value)
+        depth = getattr(node, '_cache', None)
+        if depth is None:
+            self.global_env.assign(node.name, value)
+        else:
+            self.global_env.assign_at(depth, node.name, value)
         return value
     
     def visit_BinaryOp(self, node):
         """Execute a binary operation."""
-        left = self.visit(node.left)
-        right = self.visit(node.right)
-        
-        if node.operator == '+':
-            return left + right
-        elif node.operator == '-':
-            return left - right
-        elif node.operator == '*':
-            return left * right
-        elif node.operator == '/':
-            if right == 0:
-                raise ZeroDivisionError("Division by zero")
-            return left / right
-        elif node.operator == '%':
-            return left % right
-        elif node.operator == '==':
-            return left == right
-        elif node.operator == '!=':
-            return left != right
-        elif node.operator == '<':
-            return left < right
-        elif node.operator == '>':
-            return left > right
-        elif node.operator == '<=':
-            return left <= right
-        elif node.operator == '>=':
-            return left >= right
-        elif node.operator == '&&':
-            return left and right
-        elif node.operator == '||':
-            return left or right
-        else:
-            raise ValueError(f"Unknown operator: {node.operator}")
+        # Logical operators only evaluate the right side when needed
+        if node.operator == '&&':
+            return self.visit(node.left) and self.visit(node.right)
+        if node.operator == '||':
+            return self.visit(node.left) or self.visit(node.right)
+        try:
+            op_fn = node._cache
+        except AttributeError:
+            op_fn = _BINOPS.get(node.operator)
+            if op_fn is None:
+                raise ValueError(f"Unknown operator: {node.operator}")
+            node._cache = op_fn
+        return op_fn(self.visit(node.left), self.visit(node.right))
     
     def visit_UnaryOp(self, node):
         """Execute a unary operation."""
-        operand = self.visit(node.operand)
-        
-        if node.operator == '-':
-            return -operand
-        elif node.operator == '!':
-            return not operand
-        else:
-            raise ValueError(f"Unknown unary operator: {node.operator}")
+        try:
+            op_fn = node._cache
+        except AttributeError:
+            op_fn = _UNARYOPS.get(node.operator)
+            if op_fn is None:
+                raise ValueError(f"Unknown unary operator: {node.operator}")
+            node._cache = op_fn
+        return op_fn(self.visit(node.operand))
     
     def visit_IfExpr(self, node):
         """Execute an if expression."""
-        condition = self.visit(node.condition)
-        
-        if condition:
-            env_before = self.global_env
-            self.global_env = Environment(parent=self.global_env)
-            try:
-                result = None
-                for stmt in node.then_branch:
-                    result = self.visit(stmt)
-                return result
-            finally:
-                self.global_env = env_before
+        if self.visit(node.condition):
+            branch = node.then_branch
         elif node.else_branch:
-            env_before = self.global_env
-            self.global_env = Environment(parent=self.global_env)
-            try:
-                result = None
-                for stmt in node.else_branch:
-                    result = self.visit(stmt)
-                return result
-            finally:
-                self.global_env = env_before
+            branch = node.else_branch
         else:
             return None
+        
+        env_before = self.global_env
+        self.global_env = Environment(parent=env_before)
+        result = None
+        for stmt in branch:
+            result = self.visit(stmt)
+        self.global_env = env_before
+        return result
     
     def visit_WhileLoop(self, node):
         """Execute a while loop."""
+        # One scope serves every iteration; clearing it between iterations
+        # gives the body a fresh scope without allocating a new one
+        env_before = self.global_env
+        loop = _compile_loop(node)
+        if loop is not None:
+            scopes = _loop_scopes(env_before, loop[1])
+            if scopes is not None:
+                return loop[0](*scopes)
+        
         result = None
+        loop_env = self.global_env = Environment(parent=env_before)
+        loop_vars = loop_env.vars
         while self.visit(node.condition):
-            env_before = self.global_env
-            self.global_env = Environment(parent=self.global_env)
-            try:
-                for stmt in node.body:
-                    result = self.visit(stmt)
-            finally:
-                self.global_env = env_before
+            for stmt in node.body:
+                result = self.visit(stmt)
+            loop_vars.clear()
+        self.global_env = env_before
         return result
     
     def visit_ForLoop(self, node):
-        """Execute a for loop (simplified for this demo)."""
-        # This is a simplified implementation
-        # In a full implementation, we'd need to handle different iterable types
+        """Execute a for loop over any iterable (lists, ranges, ...)."""
         iterable = self.visit(node.iterable)
         
-        if isinstance(iterable, list):
+        if hasattr(iterable, '__iter__'):
             result = None
+            variable = node.variable
+            env_before = self.global_env
+            loop_env = self.global_env = Environment(parent=env_before)
+            loop_vars = loop_env.vars
             for item in iterable:
-                env_before = self.global_env
-                self.global_env = Environment(parent=self.global_env)
-                try:
-                    self.global_env.define(node.variable, item)
-                    for stmt in node.body:
-                        result = self.visit(stmt)
-                finally:
-                    self.global_env = env_before
+                loop_vars.clear()
+                loop_vars[variable] = item
+                for stmt in node.body:
+                    result = self.visit(stmt)
+            self.global_env = env_before
             return result
         else:
             raise TypeError(f"Cannot iterate over {type(iterable)}")
     
     def visit_ReturnStmt(self, node):
         """Execute a return statement."""
-        if node.value:
-            return self.visit(node.value)
-        else:
-            return None
+        raise _ReturnSignal(self.visit(node.value) if node.value else None)
     
     def visit_FunctionCall(self, node):
         """Execute a function call."""
         # Get the function definition
-        func_def = self.global_env.get(node.name)
+        depth = getattr(node, '_cache', None)
+        if depth is None:
+            func_def = self.global_env.get(node.name)
+        else:
+            func_def = self.global_env.get_at(depth, node.name)
         
         if callable(func_def):
             # Built-in function
@@ -214,35 +647,41 @@ class Interpreter:
             return func_def(*arg_values)
         elif isinstance(func_def, FunctionDef):
             # User-defined function
-            if len(node.args) != len(func_def.params):
-                raise ValueError(f"Function {node.name} expects {len(func_def.params)} arguments but got {len(node.args)}")
+            info = func_def._cache
+            if len(node.args) != info.arity:
+                raise ValueError(f"Function {node.name} expects {info.arity} arguments but got {len(node.args)}")
             
             # Prepare arguments
             arg_values = [self.visit(arg) for arg in node.args]
-            arg_bindings = {param[0]: val for param, val in zip(func_def.params, arg_values)}
+            
+            # Transpiled functions run without building environments
+            jit = info.jit
+            if jit is not None:
+                return jit(*arg_values)
             
             # Create new environment with arguments
             old_env = self.global_env
-            self.global_env = Environment(parent=old_env)
-            for name, value in arg_bindings.items():
-                self.global_env.define(name, value)
+            call_env = self.global_env = Environment(parent=old_env)
+            call_env.vars = dict(zip(info.param_names, arg_values))
             
             try:
                 result = None
                 for stmt in func_def.body:
                     result = self.visit(stmt)
-                    # If we encounter a return statement, use its value
-                    if isinstance(stmt, ReturnStmt):
-                        return result
-                return result
-            finally:
-                self.global_env = old_env
+            except _ReturnSignal as signal:
+                # Scopes opened inside the body were not restored
+                result = signal.value
+            self.global_env = old_env
+            return result
         else:
             raise NameError(f"{node.name} is not callable")
     
     def visit_Identifier(self, node):
         """Evaluate an identifier."""
-        return self.global_env.get(node.name)
+        depth = getattr(node, '_cache', None)
+        if depth is None:
+            return self.global_env.get(node.name)
+        return self.global_env.get_at(depth, node.name)
     
     def visit_Number(self, node):
         """Evaluate a number literal."""
@@ -276,9 +715,7 @@ class Interpreter:
     
     def visit(self, node):
         """Generic visit method to dispatch to specific visitor methods."""
-        method_name = f'visit_{node.node_type}'
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
+        return self._visitors.get(node.node_type, self.generic_visit)(node)
     
     def generic_visit(self, node):
         """Called when no specific visitor method is found."""
@@ -286,7 +723,489 @@ class Interpreter:
     
     def interpret(self, ast):
         """Interpret the given AST."""
-        return self.visit(ast)
+        Resolver().resolve(ast)
+        try:
+            return self.visit(ast)
+        finally:
+            self.global_env = self._root_env
+
+
+# Opcodes for compiled Clarity programs. Code is a flat list of
+# (opcode, argument) pairs, so instruction i lives at code[2*i:2*i+2].
+LOAD_CONST = 0
+LOAD_NAME = 1
+DEFINE_NAME = 2
+STORE_NAME = 3
+POP = 4
+POP_INTO = 5
+DUP = 6
+JUMP = 7
+JUMP_IF_FALSE = 8
+BINOP_ADD = 9
+BINOP_SUB = 10
+BINOP_MUL = 11
+BINOP_DIV = 12
+BINOP_MOD = 13
+BINOP_EQ = 14
+BINOP_NEQ = 15
+BINOP_LT = 16
+BINOP_GT = 17
+BINOP_LTE = 18
+BINOP_GTE = 19
+JUMP_IF_FALSE_OR_POP = 20
+JUMP_IF_TRUE_OR_POP = 21
+UNARY_NEG = 22
+UNARY_NOT = 23
+PUSH_SCOPE = 24
+POP_SCOPE = 25
+GET_ITER = 26
+FOR_ITER = 27
+MAKE_FUNCTION = 28
+CALL = 29
+RETURN = 30
+MATCH_FAIL = 31
+LOAD_LOCAL = 32
+LOAD_AT = 33
+STORE_AT = 34
+CLEAR_SCOPE = 35
+RUN_LOOP = 36
+
+_BINOP_CODES = {
+    '+': BINOP_ADD,
+    '-': BINOP_SUB,
+    '*': BINOP_MUL,
+    '/': BINOP_DIV,
+    '%': BINOP_MOD,
+    '==': BINOP_EQ,
+    '!=': BINOP_NEQ,
+    '<': BINOP_LT,
+    '>': BINOP_GT,
+    '<=': BINOP_LTE,
+    '>=': BINOP_GTE,
+}
+
+
+class Compiler:
+    """Compiles Clarity AST nodes into flat opcode lists for the VM.
+
+    Every node compiles to code that leaves exactly one value on the stack,
+    mirroring the value each ``Interpreter.visit_*`` method returns.
+    """
+
+    def __init__(self):
+        self.consts = []
+        self.code = []
+
+    def compile(self, ast):
+        """Compile a program, returning its ``(code, consts)`` pair."""
+        self.code = []
+        Resolver().resolve(ast)
+        self.emit(ast)
+        self._op(RETURN)
+        return self.code, self.consts
+
+    def compile_function(self, func_def):
+        """Compile a function body into its own code list."""
+        outer_code = self.code
+        self.code = []
+        body = func_def.body
+        if not body:
+            self._op(LOAD_CONST, self._const(None))
+        for i, stmt in enumerate(body):
+            self.emit(stmt)
+            # The return emitted its own RETURN; the rest is unreachable
+            if isinstance(stmt, ReturnStmt):
+                break
+            if i < len(body) - 1:
+                self._op(POP)
+        else:
+            self._op(RETURN)
+        code, self.code = self.code, outer_code
+        return code, self.consts
+
+    def _op(self, opcode, arg=None):
+        self.code.append(opcode)
+        self.code.append(arg)
+        return len(self.code) - 2
+
+    def _const(self, value):
+        self.consts.append(value)
+        return len(self.consts) - 1
+
+    def _patch(self, at, target=None):
+        """Point the jump emitted at ``at`` to ``target`` (default: here)."""
+        self.code[at + 1] = len(self.code) if target is None else target
+
+    def _emit_block(self, statements):
+        """Emit a block whose value is that of its last statement."""
+        if not statements:
+            self._op(LOAD_CONST, self._const(None))
+            return
+        for i, stmt in enumerate(statements):
+            self.emit(stmt)
+            if i < len(statements) - 1:
+                self._op(POP)
+
+    def _emit_scoped_block(self, statements):
+        self._op(PUSH_SCOPE)
+        self._emit_block(statements)
+        self._op(POP_SCOPE)
+
+    def emit(self, node):
+        emitter = getattr(self, f'emit_{node.node_type}', None)
+        if emitter is None:
+            raise Exception(f'No emitter for {node.node_type}')
+        emitter(node)
+
+    def emit_Program(self, node):
+        self._emit_block(node.statements)
+
+    def emit_FunctionDef(self, node):
+        _prepare_function(node).code = self.compile_function(node)
+        self._op(MAKE_FUNCTION, node)
+
+    def emit_VariableDecl(self, node):
+        self.emit(node.value)
+        self._op(DEFINE_NAME, node.name)
+
+    def emit_ConstantDecl(self, node):
+        self.emit(node.value)
+        self._op(DEFINE_NAME, node.name)
+
+    def emit_Assignment(self, node):
+        self.emit(node.value)
+        depth = node._cache
+        if depth is None:
+            self._op(STORE_NAME, node.name)
+        else:
+            self._op(STORE_AT, (depth, node.name))
+
+    def _emit_load(self, name, depth):
+        if depth is None:
+            self._op(LOAD_NAME, name)
+        elif depth == 0:
+            self._op(LOAD_LOCAL, name)
+        else:
+            self._op(LOAD_AT, (depth, name))
+
+    def emit_BinaryOp(self, node):
+        if node.operator == '&&' or node.operator == '||':
+            # Keep the left value if it decides the result, else replace it
+            self.emit(node.left)
+            jump = JUMP_IF_FALSE_OR_POP if node.operator == '&&' else JUMP_IF_TRUE_OR_POP
+            to_end = self._op(jump)
+            self.emit(node.right)
+            self._patch(to_end)
+            return
+        opcode = _BINOP_CODES.get(node.operator)
+        if opcode is None:
+            raise ValueError(f"Unknown operator: {node.operator}")
+        self.emit(node.left)
+        self.emit(node.right)
+        self._op(opcode)
+
+    def emit_UnaryOp(self, node):
+        if node.operator == '-':
+            opcode = UNARY_NEG
+        elif node.operator == '!':
+            opcode = UNARY_NOT
+        else:
+            raise ValueError(f"Unknown unary operator: {node.operator}")
+        self.emit(node.operand)
+        self._op(opcode)
+
+    def emit_IfExpr(self, node):
+        self.emit(node.condition)
+        to_else = self._op(JUMP_IF_FALSE)
+        self._emit_scoped_block(node.then_branch)
+        to_end = self._op(JUMP)
+        self._patch(to_else)
+        if node.else_branch:
+            self._emit_scoped_block(node.else_branch)
+        else:
+            self._op(LOAD_CONST, self._const(None))
+        self._patch(to_end)
+
+    def emit_WhileLoop(self, node):
+        # Straight-line loops run as generated Python when every name they
+        # use is bound; otherwise RUN_LOOP falls through to the code below
+        loop = _compile_loop(node)
+        if loop is not None:
+            run_loop = self._op(RUN_LOOP)
+        # The loop's value sits below the body and is replaced by each
+        # statement's value in turn, as visit_WhileLoop does
+        self._op(LOAD_CONST, self._const(None))
+        self._op(PUSH_SCOPE)
+        top = len(self.code)
+        self.emit(node.condition)
+        to_end = self._op(JUMP_IF_FALSE)
+        for stmt in node.body:
+            self.emit(stmt)
+            self._op(POP_INTO, 1)
+        self._op(CLEAR_SCOPE)
+        self._op(JUMP, top)
+        self._patch(to_end)
+        self._op(POP_SCOPE)
+        if loop is not None:
+            self.code[run_loop + 1] = (loop[0], loop[1], len(self.code))
+
+    def emit_ForLoop(self, node):
+        self._op(LOAD_CONST, self._const(None))
+        self.emit(node.iterable)
+        self._op(GET_ITER)
+        self._op(PUSH_SCOPE)
+        top = self._op(FOR_ITER)
+        self._op(DEFINE_NAME, node.variable)
+        self._op(POP)
+        for stmt in node.body:
+            self.emit(stmt)
+            self._op(POP_INTO, 2)
+        self._op(CLEAR_SCOPE)
+        self._op(JUMP, top)
+        self._patch(top)
+        self._op(POP_SCOPE)
+
+    def emit_ReturnStmt(self, node):
+        if node.value:
+            self.emit(node.value)
+        else:
+            self._op(LOAD_CONST, self._const(None))
+        self._op(RETURN)
+
+    def emit_FunctionCall(self, node):
+        self._emit_load(node.name, node._cache)
+        for arg in node.args:
+            self.emit(arg)
+        self._op(CALL, (node.name, len(node.args)))
+
+    def emit_Identifier(self, node):
+        self._emit_load(node.name, node._cache)
+
+    def emit_Number(self, node):
+        self._op(LOAD_CONST, self._const(node.value))
+
+    def emit_String(self, node):
+        self._op(LOAD_CONST, self._const(node.value))
+
+    def emit_Boolean(self, node):
+        self._op(LOAD_CONST, self._const(node.value))
+
+    def emit_MatchExpr(self, node):
+        self.emit(node.expr)
+        to_end = []
+        for pattern, result_expr in node.arms:
+            if isinstance(pattern, (Number, String, Boolean)):
+                self._op(DUP)
+                self._op(LOAD_CONST, self._const(pattern.value))
+                self._op(BINOP_EQ)
+                to_next = self._op(JUMP_IF_FALSE)
+                self._op(POP)
+                self.emit(result_expr)
+                to_end.append(self._op(JUMP))
+                self._patch(to_next)
+            elif isinstance(pattern, Identifier):
+                # Catch-all arm: later arms are unreachable
+                self._op(POP)
+                self.emit(result_expr)
+                to_end.append(self._op(JUMP))
+                break
+        else:
+            self._op(MATCH_FAIL)
+        for at in to_end:
+            self._patch(at)
+
+
+def compile_program(ast):
+    """Compile a Clarity AST into ``(code, consts)`` for the VM."""
+    return Compiler().compile(ast)
+
+
+class VM(Interpreter):
+    """Executes compiled Clarity programs in a single dispatch loop.
+
+    Function calls push a frame onto an explicit frame stack rather than
+    recursing in Python, so deep Clarity recursion costs no Python frames.
+    Run as Python, the if/elif dispatch is slower than the Interpreter's
+    visitor lookup; it pays off in the compiled clarity_vm build.
+    """
+
+    def interpret(self, ast):
+        """Compile and execute the given AST."""
+        code, consts = compile_program(ast)
+        return self.execute(code, consts)
+
+    def execute(self, code, consts):
+        """Run compiled code in the global environment."""
+        env = self.global_env
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        frames = []
+        ip = 0
+
+        while True:
+            op = code[ip]
+            arg = code[ip + 1]
+            ip += 2
+
+            if op == LOAD_LOCAL:
+                push(env.vars[arg])
+            elif op == LOAD_CONST:
+                push(consts[arg])
+            elif op == JUMP_IF_FALSE:
+                if not pop():
+                    ip = arg
+            elif op == JUMP:
+                ip = arg
+            elif op == LOAD_AT:
+                push(env.get_at(*arg))
+            elif op == LOAD_NAME:
+                push(env.get(arg))
+            elif op == POP:
+                pop()
+            elif op == POP_INTO:
+                value = pop()
+                stack[-arg] = value
+            elif op == BINOP_ADD:
+                b = pop()
+                stack[-1] = stack[-1] + b
+            elif op == BINOP_SUB:
+                b = pop()
+                stack[-1] = stack[-1] - b
+            elif op == BINOP_MUL:
+                b = pop()
+                stack[-1] = stack[-1] * b
+            elif op == BINOP_LT:
+                b = pop()
+                stack[-1] = stack[-1] < b
+            elif op == BINOP_GT:
+                b = pop()
+                stack[-1] = stack[-1] > b
+            elif op == BINOP_LTE:
+                b = pop()
+                stack[-1] = stack[-1] <= b
+            elif op == BINOP_GTE:
+                b = pop()
+                stack[-1] = stack[-1] >= b
+            elif op == BINOP_EQ:
+                b = pop()
+                stack[-1] = stack[-1] == b
+            elif op == BINOP_NEQ:
+                b = pop()
+                stack[-1] = stack[-1] != b
+            elif op == BINOP_DIV:
+                b = pop()
+                if b == 0:
+                    raise ZeroDivisionError("Division by zero")
+                stack[-1] = stack[-1] / b
+            elif op == BINOP_MOD:
+                b = pop()
+                stack[-1] = stack[-1] % b
+            elif op == JUMP_IF_FALSE_OR_POP:
+                if stack[-1]:
+                    pop()
+                else:
+                    ip = arg
+            elif op == JUMP_IF_TRUE_OR_POP:
+                if stack[-1]:
+                    ip = arg
+                else:
+                    pop()
+            elif op == UNARY_NEG:
+                stack[-1] = -stack[-1]
+            elif op == UNARY_NOT:
+                stack[-1] = not stack[-1]
+            elif op == DEFINE_NAME:
+                env.define(arg, stack[-1])
+            elif op == STORE_AT:
+                env.assign_at(arg[0], arg[1], stack[-1])
+            elif op == STORE_NAME:
+                env.assign(arg, stack[-1])
+            elif op == PUSH_SCOPE:
+                env = Environment(parent=env)
+            elif op == POP_SCOPE:
+                env = env.parent
+            elif op == CLEAR_SCOPE:
+                env.vars.clear()
+            elif op == CALL:
+                name, argc = arg
+                if argc:
+                    args = stack[-argc:]
+                    del stack[-argc:]
+                else:
+                    args = []
+                func = pop()
+                if callable(func):
+                    push(func(*args))
+                elif isinstance(func, FunctionDef):
+                    info = func._cache
+                    if argc != info.arity:
+                        raise ValueError(f"Function {name} expects {info.arity} arguments but got {argc}")
+                    jit = info.jit
+                    if jit is not None:
+                        push(jit(*args))
+                        continue
+                    frames.append((code, consts, ip, env, len(stack)))
+                    env = Environment(parent=env)
+                    env.vars = dict(zip(info.param_names, args))
+                    compiled = info.code
+                    if compiled is None:
+                        compiled = info.code = Compiler().compile_function(func)
+                    code, consts = compiled
+                    ip = 0
+                else:
+                    raise NameError(f"{name} is not callable")
+            elif op == RETURN:
+                value = pop()
+                if not frames:
+                    return value
+                code, consts, ip, env, base = frames.pop()
+                del stack[base:]
+                push(value)
+            elif op == DUP:
+                push(stack[-1])
+            elif op == GET_ITER:
+                iterable = stack[-1]
+                if not hasattr(iterable, '__iter__'):
+                    raise TypeError(f"Cannot iterate over {type(iterable)}")
+                stack[-1] = iter(iterable)
+            elif op == FOR_ITER:
+                item = next(stack[-1], _EXHAUSTED)
+                if item is _EXHAUSTED:
+                    pop()
+                    ip = arg
+                else:
+                    push(item)
+            elif op == MAKE_FUNCTION:
+                _prepare_function(arg)
+                env.define(arg.name, arg)
+                push(None)
+            elif op == RUN_LOOP:
+                loop_fn, names, end = arg
+                scopes = _loop_scopes(env, names)
+                if scopes is not None:
+                    push(loop_fn(*scopes))
+                    ip = end
+            elif op == MATCH_FAIL:
+                raise ValueError(f"No match found for value: {pop()}")
+            else:
+                raise Exception(f'Unknown opcode {op}')
+
+
+_EXHAUSTED = object()
+
+
+@lru_cache(maxsize=256)
+def _parse_cached(source, expression=False):
+    """Parse Clarity source, reusing the AST when the source was seen before.
+
+    Cached ASTs are shared between callers; execution only annotates them
+    (resolved depths, compiled code), which is the same for every run.
+    """
+    parser = Parser(Lexer(source))
+    if expression:
+        return parser.parse_expression()
+    return parser.parse_program()
 
 
 def run_file(filename):
@@ -294,12 +1213,17 @@ def run_file(filename):
     with open(filename, 'r') as f:
         source = f.read()
     
-    lexer = Lexer(source)
-    parser = Parser(lexer)
-    ast = parser.parse_program()
+    ast = _parse_cached(source)
     
-    interpreter = Interpreter()
-    result = interpreter.interpret(ast)
+    try:
+        # Cython build of the dispatch loop (python setup.py build_ext --inplace)
+        from clarity_vm import VM as engine_class
+    except ImportError:
+        # The pure-Python VM is slower than the Interpreter (see
+        # benchmark_engines.py), so only the compiled one replaces it
+        engine_class = Interpreter
+    engine = engine_class()
+    result = engine.interpret(ast)
     return result
 
 
@@ -320,11 +1244,9 @@ def repl():
             if not line.strip():
                 continue
                 
-            lexer = Lexer(line)
-            parser = Parser(lexer)
-            ast = parser.parse_expression()
+            ast = _parse_cached(line, expression=True)
             
-            result = interpreter.visit(ast)
+            result = interpreter.interpret(ast)
             print(result)
             
         except KeyboardInterrupt:
@@ -335,8 +1257,6 @@ def repl():
 
 
 if __name__ == "__main__":
-    import sys
-    
     if len(sys.argv) > 1:
         # Run a file
         filename = sys.argv[1]
@@ -0,0 +1,33 @@
+# cython: language_level=3
+# Augmenting declarations for compiling clarity_parser.py with Cython
+# (see setup.py). The Lexer and Parser become extension types with
+# C-typed position counters and token cursor, still readable from the
+# module-level handler functions and dispatch tables.
+
+cdef class Lexer:
+    cdef readonly str text
+    cdef readonly Py_ssize_t pos
+    cdef readonly object current_char
+    cdef readonly Py_ssize_t line
+    cdef readonly Py_ssize_t column
+
+    cpdef advance(self)
+    cpdef _skip_to(self, Py_ssize_t pos)
+    cpdef peek(self)
+    cpdef skip_whitespace(self)
+    cpdef skip_comment(self)
+    cpdef str read_number(self)
+    cpdef str read_identifier(self)
+    cpdef str read_string(self)
+    cpdef get_next_token(self)
+    cpdef list tokenize(self)
+
+
+cdef class Parser:
+    cdef readonly Lexer lexer
+    cdef readonly list tokens
+    cdef readonly Py_ssize_t index
+    cdef readonly object current_token
+
+    cpdef eat(self, token_type)
+    cpdef _advance(self)
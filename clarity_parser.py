@@ -5,70 +5,73 @@ Implements the full syntax as defined in the language specification.
 """
 
 import re
-import sys
-from enum import Enum
-from typing import List, Dict, Any, Optional, Union
+from enum import IntEnum
+from sys import intern
+from typing import List, Optional
 
 
-class TokenType(Enum):
+class TokenType(IntEnum):
+    """Token kinds; plain ints so type checks are integer comparisons."""
     # Literals
-    IDENTIFIER = "IDENTIFIER"
-    NUMBER = "NUMBER"
-    STRING = "STRING"
+    IDENTIFIER = 0
+    NUMBER = 1
+    STRING = 2
     
     # Keywords
-    FN = "FN"
-    LET = "LET"
-    VAR = "VAR"
-    CONST = "CONST"
-    IF = "IF"
-    ELSE = "ELSE"
-    WHILE = "WHILE"
-    FOR = "FOR"
-    IN = "IN"
-    RETURN = "RETURN"
-    MATCH = "MATCH"
-    ASYNC = "ASYNC"
-    AWAIT = "AWAIT"
-    TRUE = "TRUE"
-    FALSE = "FALSE"
+    FN = 3
+    LET = 4
+    VAR = 5
+    CONST = 6
+    IF = 7
+    ELSE = 8
+    WHILE = 9
+    FOR = 10
+    IN = 11
+    RETURN = 12
+    MATCH = 13
+    ASYNC = 14
+    AWAIT = 15
+    TRUE = 16
+    FALSE = 17
     
     # Operators
-    PLUS = "PLUS"
-    MINUS = "MINUS"
-    MULTIPLY = "MULTIPLY"
-    DIVIDE = "DIVIDE"
-    MODULO = "MODULO"   # %
-    ASSIGN = "ASSIGN"
-    EQ = "EQ"           # ==
-    NEQ = "NEQ"         # !=
-    LT = "LT"           # <
-    GT = "GT"           # >
-    LTE = "LTE"         # <=
-    GTE = "GTE"         # >=
-    AND = "AND"         # &&
-    OR = "OR"           # ||
-    NOT = "NOT"         # !
+    PLUS = 18
+    MINUS = 19
+    MULTIPLY = 20
+    DIVIDE = 21
+    MODULO = 22         # %
+    ASSIGN = 23
+    EQ = 24             # ==
+    NEQ = 25            # !=
+    LT = 26             # <
+    GT = 27             # >
+    LTE = 28            # <=
+    GTE = 29            # >=
+    AND = 30            # &&
+    OR = 31             # ||
+    NOT = 32            # !
     
     # Delimiters
-    LPAREN = "LPAREN"       # (
-    RPAREN = "RPAREN"       # )
-    LBRACE = "LBRACE"       # {
-    RBRACE = "RBRACE"       # }
-    LBRACKET = "LBRACKET"   # [
-    RBRACKET = "RBRACKET"   # ]
-    COMMA = "COMMA"         # ,
-    COLON = "COLON"         # :
-    ARROW = "ARROW"         # ->
-    DOT = "DOT"             # .
-    SEMICOLON = "SEMICOLON" # ;
+    LPAREN = 33         # (
+    RPAREN = 34         # )
+    LBRACE = 35         # {
+    RBRACE = 36         # }
+    LBRACKET = 37       # [
+    RBRACKET = 38       # ]
+    COMMA = 39          # ,
+    COLON = 40          # :
+    ARROW = 41          # ->
+    FAT_ARROW = 42      # =>
+    DOT = 43            # .
+    SEMICOLON = 44      # ;
     
     # Other
-    EOF = "EOF"
+    EOF = 45
 
 
 class Token:
     """Represents a lexical token in our language."""
+    __slots__ = ('type', 'value', 'line', 'column')
     
     def __init__(self, type_: TokenType, value: str, line: int, column: int):
         self.type = type_
@@ -97,12 +100,10 @@ class Lexer:
             self.column = 0
         else:
             self.column += 1
-            
-        self.pos += 1
-        if self.pos >= len(self.text):
-            self.current_char = None
-        else:
-            self.current_char = self.text[self.pos]
+        
+        text = self.text
+        pos = self.pos = self.pos + 1
+        self.current_char = text[pos] if pos < len(text) else None
     
     def peek(self) -> Optional[str]:
         """Look at the next character without advancing position."""
@@ -111,297 +112,523 @@ class Lexer:
             return None
         return self.text[peek_pos]
     
+    def _skip_to(self, pos):
+        """Jump ahead to pos, updating line/column for the skipped text."""
+        text = self.text
+        newlines = text.count('\n', self.pos, pos)
+        if newlines:
+            self.line += newlines
+            self.column = pos - text.rfind('\n', self.pos, pos) - 1
+        else:
+            self.column += pos - self.pos
+        self.pos = pos
+        self.current_char = text[pos] if pos < len(text) else None
+    
     def skip_whitespace(self):
         """Skip over whitespace characters."""
-        while self.current_char is not None and self.current_char.isspace():
-            self.advance()
+        self._skip_to(_SPACE_RUN.match(self.text, self.pos).end())
     
     def skip_comment(self):
         """Skip over single-line comments."""
-        while self.current_char is not None and self.current_char != '\n':
-            self.advance()
+        pos = self.text.find('\n', self.pos)
+        self._skip_to(len(self.text) if pos == -1 else pos)
     
     def read_number(self) -> str:
         """Read a number token."""
-        result = ''
-        while self.current_char is not None and self.current_char.isdigit():
-            result += self.current_char
-            self.advance()
-        return result
+        text = self.text
+        start = self.pos
+        pos = _DIGIT_RUN.match(text, start).end()
+        # Non-ASCII digits (str.isdigit, e.g. '٣' or '²') take the slow path
+        end = len(text)
+        while pos < end and text[pos].isdigit():
+            pos += 1
+        self._skip_to(pos)
+        return text[start:pos]
     
     def read_identifier(self) -> str:
         """Read an identifier token."""
-        result = ''
-        while self.current_char is not None and (self.current_char.isalnum() or self.current_char == '_'):
-            result += self.current_char
-            self.advance()
-        return result
+        text = self.text
+        start = self.pos
+        pos = _IDENT_RUN.match(text, start).end()
+        self._skip_to(pos)
+        return intern(text[start:pos])
     
     def read_string(self) -> str:
         """Read a string literal."""
-        result = ''
+        text = self.text
         quote_char = self.current_char  # Store opening quote
-        self.advance()  # Skip opening quote
-        
-        while self.current_char is not None and self.current_char != quote_char:
-            if self.current_char == '\\':  # Handle escape sequences
-                self.advance()
-                if self.current_char is not None:
-                    result += self.current_char
-                    self.advance()
-            else:
-                result += self.current_char
-                self.advance()
+        start = self.pos + 1  # Skip opening quote
+        # The body runs up to the closing quote, escapes included; a
+        # backslash at the very end of the input escapes nothing
+        pos = _STRING_BODY[quote_char].match(text, start).end()
+        result = text[start:pos]
+        if '\\' in result:
+            result = _ESCAPE_SEQ.sub(_unescape, result)
         
+        self._skip_to(pos)
         if self.current_char == quote_char:
             self.advance()  # Skip closing quote
         
-        return result
+        return intern(result)
     
     def get_next_token(self) -> Token:
         """Get the next token from the input."""
         while self.current_char is not None:
-            if self.current_char.isspace():
-                self.skip_whitespace()
-                continue
-            
-            # Comments
-            if self.current_char == '/' and self.peek() == '/':
-                self.advance()  # skip first '/'
-                self.advance()  # skip second '/'
-                self.skip_comment()
+            code = ord(self.current_char)
+            if code < 128:
+                handler = _ASCII_DISPATCH[code]
+                if handler is None:
+                    raise Exception(f"Illegal character '{self.current_char}' at {self.line}:{self.column}")
+                token = handler(self)
+            else:
+                token = self._lex_non_ascii()
+            # Handlers return None after skipping whitespace or a comment
+            if token is not None:
+                return token
+        
+        return Token(TokenType.EOF, '', self.line, self.column)
+    
+    def __iter__(self):
+        """Yield the remaining tokens, ending with EOF."""
+        get_next_token = self.get_next_token
+        while True:
+            token = get_next_token()
+            yield token
+            if token.type == TokenType.EOF:
+                return
+    
+    def tokenize(self) -> List[Token]:
+        """Lex the remaining input into a list of tokens ending with EOF.
+
+        Whitespace, comments, identifiers, numbers and operators are
+        matched by _TOKEN_RE in one pass. Anything else (strings,
+        non-ASCII text, illegal characters) is handed to get_next_token
+        for one token, so both paths give the same tokens and errors.
+        """
+        text = self.text
+        end = len(text)
+        tokens = []
+        append = tokens.append
+        match_token = _TOKEN_RE.match
+        keywords = _KEYWORDS
+        operators = _OPERATOR_TOKENS
+        identifier = TokenType.IDENTIFIER
+        number = TokenType.NUMBER
+        pos = self.pos
+        line = self.line
+        line_start = pos - self.column  # offset of the current line's first character
+        while pos < end:
+            match = match_token(text, pos)
+            if match is None:
+                self.pos, self.line, self.column = pos, line, pos - line_start
+                self.current_char = text[pos]
+                append(self.get_next_token())
+                pos, line = self.pos, self.line
+                line_start = pos - self.column
                 continue
             
-            if self.current_char.isdigit():
-                start_line, start_col = self.line, self.column
-                value = self.read_number()
-                return Token(TokenType.NUMBER, value, start_line, start_col)
-            
-            if self.current_char.isalpha() or self.current_char == '_':
-                start_line, start_col = self.line, self.column
-                value = self.read_identifier()
-                
-                # Check if it's a keyword
-                keyword_map = {
-                    'fn': TokenType.FN,
-                    'let': TokenType.LET,
-                    'var': TokenType.VAR,
-                    'const': TokenType.CONST,
-                    'if': TokenType.IF,
-                    'else': TokenType.ELSE,
-                    'while': TokenType.WHILE,
-                    'for': TokenType.FOR,
-                    'in': TokenType.IN,
-                    'return': TokenType.RETURN,
-                    'match': TokenType.MATCH,
-                    'async': TokenType.ASYNC,
-                    'await': TokenType.AWAIT,
-                    'true': TokenType.TRUE,
-                    'false': TokenType.FALSE,
-                }
-                
-                token_type = keyword_map.get(value.lower(), TokenType.IDENTIFIER)
-                return Token(token_type, value, start_line, start_col)
-            
-            if self.current_char in ['"', "'"]:
-                start_line, start_col = self.line, self.column
-                value = self.read_string()
-                return Token(TokenType.STRING, value, start_line, start_col)
-            
-            # Multi-character operators
-            if self.current_char == '=' and self.peek() == '>':
-                self.advance()
-                self.advance()
-                return Token(TokenType.ARROW, '->', self.line, self.column - 1)
-            
-            # Two-character operators
-            if self.current_char == '-' and self.peek() == '>':
-                self.advance()
-                self.advance()
-                return Token(TokenType.ARROW, '->', self.line, self.column - 1)
-            elif self.current_char == '=' and self.peek() == '=':
-                self.advance()
-                self.advance()
-                return Token(TokenType.EQ, '==', self.line, self.column - 1)
-            elif self.current_char == '!' and self.peek() == '=':
-                self.advance()
-                self.advance()
-                return Token(TokenType.NEQ, '!=', self.line, self.column - 1)
-            elif self.current_char == '<' and self.peek() == '=':
-                self.advance()
-                self.advance()
-                return Token(TokenType.LTE, '<=', self.line, self.column - 1)
-            elif self.current_char == '>' and self.peek() == '=':
-                self.advance()
-                self.advance()
-                return Token(TokenType.GTE, '>=', self.line, self.column - 1)
-            elif self.current_char == '&' and self.peek() == '&':
-                self.advance()
-                self.advance()
-                return Token(TokenType.AND, '&&', self.line, self.column - 1)
-            elif self.current_char == '|' and self.peek() == '|':
-                self.advance()
-                self.advance()
-                return Token(TokenType.OR, '||', self.line, self.column - 1)
-            
-            # Single character tokens
-            char_tokens = {
-                '+': TokenType.PLUS,
-                '-': TokenType.MINUS,
-                '*': TokenType.MULTIPLY,
-                '/': TokenType.DIVIDE,
-                '%': TokenType.MODULO,
-                '=': TokenType.ASSIGN,
-                '!': TokenType.NOT,
-                '<': TokenType.LT,
-                '>': TokenType.GT,
-                '(': TokenType.LPAREN,
-                ')': TokenType.RPAREN,
-                '{': TokenType.LBRACE,
-                '}': TokenType.RBRACE,
-                '[': TokenType.LBRACKET,
-                ']': TokenType.RBRACKET,
-                ',': TokenType.COMMA,
-                ':': TokenType.COLON,
-                '.': TokenType.DOT,
-                ';': TokenType.SEMICOLON,
-            }
-            
-            if self.current_char in char_tokens:
-                char = self.current_char
-                start_line, start_col = self.line, self.column
-                self.advance()
-                return Token(char_tokens[char], char, start_line, start_col)
-            
-            # Unknown character
-            raise Exception(f"Illegal character '{self.current_char}' at {self.line}:{self.column}")
+            kind = match.lastindex
+            next_pos = match.end()
+            if kind == _SPACE_GROUP:
+                newlines = text.count('\n', pos, next_pos)
+                if newlines:
+                    line += newlines
+                    line_start = text.rfind('\n', pos, next_pos) + 1
+            elif kind == _IDENT_GROUP:
+                value = intern(match.group())
+                append(Token(keywords.get(value, identifier), value, line, pos - line_start))
+            elif kind == _OPERATOR_GROUP:
+                token_type, value = operators[match.group()]
+                append(Token(token_type, value, line, pos - line_start))
+            else:
+                append(Token(number, match.group(), line, pos - line_start))
+            pos = next_pos
         
-        return Token(TokenType.EOF, '', self.line, self.column)
+        self.pos, self.line, self.column = pos, line, pos - line_start
+        self.current_char = None
+        append(Token(TokenType.EOF, '', self.line, self.column))
+        return tokens
+    
+    def _lex_whitespace(self):
+        self.skip_whitespace()
+    
+    def _lex_slash(self):
+        if self.peek() == '/':
+            self.skip_comment()  # runs to the end of the line, '//' included
+            return None
+        return self._lex_single()
+    
+    def _lex_number(self):
+        start_line, start_col = self.line, self.column
+        value = self.read_number()
+        return Token(TokenType.NUMBER, value, start_line, start_col)
+    
+    def _lex_identifier(self):
+        start_line, start_col = self.line, self.column
+        value = self.read_identifier()
+        
+        # Check if it's a keyword; most identifiers miss on length alone
+        if len(value) < len(_KEYWORDS_BY_LEN):
+            token_type = _KEYWORDS_BY_LEN[len(value)].get(value, TokenType.IDENTIFIER)
+        else:
+            token_type = TokenType.IDENTIFIER
+        return Token(token_type, value, start_line, start_col)
+    
+    def _lex_string(self):
+        start_line, start_col = self.line, self.column
+        value = self.read_string()
+        return Token(TokenType.STRING, value, start_line, start_col)
+    
+    def _lex_operator(self):
+        """Lex an operator that may be the first of a two-character pair."""
+        pair = _TWO_CHAR_TOKENS[self.current_char].get(self.peek())
+        if pair is not None:
+            start_col = self.column
+            self._skip_to(self.pos + 2)
+            return Token(pair[0], pair[1], self.line, start_col)
+        if self.current_char not in _SINGLE_CHAR_TOKENS:
+            raise Exception(f"Illegal character '{self.current_char}' at {self.line}:{self.column}")
+        return self._lex_single()
+    
+    def _lex_single(self):
+        token_type, value = _SINGLE_CHAR_TOKENS[self.current_char]
+        start_line, start_col = self.line, self.column
+        self.advance()
+        return Token(token_type, value, start_line, start_col)
+    
+    def _lex_non_ascii(self):
+        """Slow path for characters outside the ASCII dispatch table."""
+        char = self.current_char
+        if char.isspace():
+            self.skip_whitespace()
+            return None
+        if char.isdigit():
+            return self._lex_number()
+        if char.isalpha():
+            return self._lex_identifier()
+        raise Exception(f"Illegal character '{char}' at {self.line}:{self.column}")
+
+
+# Run scanners: the regex engine consumes a whole identifier, digit or
+# whitespace run in C. \w and \s match exactly str.isalnum() or '_' and
+# str.isspace(), so token boundaries are unchanged.
+_IDENT_RUN = re.compile(r'\w*')
+_DIGIT_RUN = re.compile(r'[0-9]*')
+_SPACE_RUN = re.compile(r'\s*')
+
+# Escape sequences inside string literals; any other escaped character
+# stands for itself
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '0': '\0'}
+_ESCAPE_SEQ = re.compile(r'\\(.?)', re.DOTALL)
+
+# String bodies for each quote character, matched in one call
+_STRING_BODY = {
+    '"': re.compile(r'[^"\\]*(?:\\.?[^"\\]*)*', re.DOTALL),
+    "'": re.compile(r"[^'\\]*(?:\\.?[^'\\]*)*", re.DOTALL),
+}
+
+
+def _unescape(match) -> str:
+    """Replacement for one escape sequence in a string literal."""
+    escaped = match.group(1)
+    return _ESCAPES.get(escaped, escaped)
+
+
+_KEYWORDS = {
+    'fn': TokenType.FN,
+    'let': TokenType.LET,
+    'var': TokenType.VAR,
+    'const': TokenType.CONST,
+    'if': TokenType.IF,
+    'else': TokenType.ELSE,
+    'while': TokenType.WHILE,
+    'for': TokenType.FOR,
+    'in': TokenType.IN,
+    'return': TokenType.RETURN,
+    'match': TokenType.MATCH,
+    'async': TokenType.ASYNC,
+    'await': TokenType.AWAIT,
+    'true': TokenType.TRUE,
+    'false': TokenType.FALSE,
+}
+
+# _KEYWORDS split by length: _KEYWORDS_BY_LEN[n] holds the n-letter keywords
+_KEYWORDS_BY_LEN = tuple(
+    {word: token_type for word, token_type in _KEYWORDS.items() if len(word) == length}
+    for length in range(max(map(len, _KEYWORDS)) + 1)
+)
+
+# Character -> (token type, token value). Operator and delimiter tokens
+# share these constant values instead of carrying the source character.
+_SINGLE_CHAR_TOKENS = {
+    '+': (TokenType.PLUS, '+'),
+    '-': (TokenType.MINUS, '-'),
+    '*': (TokenType.MULTIPLY, '*'),
+    '/': (TokenType.DIVIDE, '/'),
+    '%': (TokenType.MODULO, '%'),
+    '=': (TokenType.ASSIGN, '='),
+    '!': (TokenType.NOT, '!'),
+    '<': (TokenType.LT, '<'),
+    '>': (TokenType.GT, '>'),
+    '(': (TokenType.LPAREN, '('),
+    ')': (TokenType.RPAREN, ')'),
+    '{': (TokenType.LBRACE, '{'),
+    '}': (TokenType.RBRACE, '}'),
+    '[': (TokenType.LBRACKET, '['),
+    ']': (TokenType.RBRACKET, ']'),
+    ',': (TokenType.COMMA, ','),
+    ':': (TokenType.COLON, ':'),
+    '.': (TokenType.DOT, '.'),
+    ';': (TokenType.SEMICOLON, ';'),
+}
+
+# First character -> {second character: (token type, token value)}
+_TWO_CHAR_TOKENS = {
+    '=': {'>': (TokenType.FAT_ARROW, '=>'), '=': (TokenType.EQ, '==')},
+    '-': {'>': (TokenType.ARROW, '->')},
+    '!': {'=': (TokenType.NEQ, '!=')},
+    '<': {'=': (TokenType.LTE, '<=')},
+    '>': {'=': (TokenType.GTE, '>=')},
+    '&': {'&': (TokenType.AND, '&&')},
+    '|': {'|': (TokenType.OR, '||')},
+}
+
+
+def _single_char_lexer(token_type, value):
+    """Build a handler for a character that is always a token on its own."""
+    def lex(lexer):
+        start_line, start_col = lexer.line, lexer.column
+        lexer.advance()
+        return Token(token_type, value, start_line, start_col)
+    return lex
+
+
+def _build_ascii_dispatch():
+    """Map each ASCII code to the Lexer method that starts its token."""
+    table = [None] * 128
+    for code in range(128):
+        char = chr(code)
+        if char.isspace():
+            table[code] = Lexer._lex_whitespace
+        elif char.isdigit():
+            table[code] = Lexer._lex_number
+        elif char.isalpha() or char == '_':
+            table[code] = Lexer._lex_identifier
+        elif char in '"\'':
+            table[code] = Lexer._lex_string
+        elif char == '/':
+            table[code] = Lexer._lex_slash
+        elif char in _TWO_CHAR_TOKENS:
+            table[code] = Lexer._lex_operator
+        elif char in _SINGLE_CHAR_TOKENS:
+            table[code] = _single_char_lexer(*_SINGLE_CHAR_TOKENS[char])
+    return table
+
+
+_ASCII_DISPATCH = _build_ascii_dispatch()
+
+# Every operator and delimiter lexeme, two-character ones included
+_OPERATOR_TOKENS = dict(_SINGLE_CHAR_TOKENS)
+for _first, _pairs in _TWO_CHAR_TOKENS.items():
+    for _second, _token in _pairs.items():
+        _OPERATOR_TOKENS[_first + _second] = _token
+del _first, _pairs, _second, _token
+
+# Batch scanner for Lexer.tokenize: one alternation for the common ASCII
+# tokens. A number directly followed by a non-ASCII character is left to
+# read_number (str.isdigit accepts more than [0-9]); strings and anything
+# else that does not match go through get_next_token.
+_TOKEN_RE = re.compile('|'.join([
+    r'(?P<SPACE>(?:\s+|//[^\n]*)+)',
+    r'(?P<IDENT>[A-Za-z_]\w*)',
+    r'(?P<NUMBER>[0-9]+(?![0-9]|[^\x00-\x7f]))',
+    '(?P<OPERATOR>%s)' % '|'.join(
+        map(re.escape, sorted(_OPERATOR_TOKENS, key=len, reverse=True))),
+]))
+_SPACE_GROUP = _TOKEN_RE.groupindex['SPACE']
+_IDENT_GROUP = _TOKEN_RE.groupindex['IDENT']
+_OPERATOR_GROUP = _TOKEN_RE.groupindex['OPERATOR']
 
 
 class ASTNode:
-    """Base class for Abstract Syntax Tree nodes."""
-    pass
+    """Base class for Abstract Syntax Tree nodes.
+
+    Nodes use __slots__, so every attribute set on them must be listed.
+    Besides the syntax fields that is the source line recorded by the
+    translator and ``_cache``, which belongs to the interpreter.
+    """
+    __slots__ = ('line', '_cache')
+    node_type = 'ASTNode'
 
 
 class Program(ASTNode):
+    __slots__ = ('statements',)
+    node_type = 'Program'
+    
     def __init__(self, statements):
         self.statements = statements
-        self.node_type = 'Program'
 
 
 class FunctionDef(ASTNode):
+    __slots__ = ('name', 'params', 'return_type', 'body', 'line_range')
+    node_type = 'FunctionDef'
+    
     def __init__(self, name, params, return_type, body):
         self.name = name
         self.params = params  # List of (name, type) tuples
         self.return_type = return_type
         self.body = body  # List of statements
-        self.node_type = 'FunctionDef'
 
 
 class VariableDecl(ASTNode):
+    __slots__ = ('mutable', 'name', 'var_type', 'value')
+    node_type = 'VariableDecl'
+    
     def __init__(self, mutable, name, var_type, value):
         self.mutable = mutable  # True for 'var', False for 'let'
         self.name = name
         self.var_type = var_type
         self.value = value
-        self.node_type = 'VariableDecl'
 
 
 class ConstantDecl(ASTNode):
+    __slots__ = ('name', 'value')
+    node_type = 'ConstantDecl'
+    
     def __init__(self, name, value):
         self.name = name
         self.value = value
-        self.node_type = 'ConstantDecl'
 
 
 class Assignment(ASTNode):
+    __slots__ = ('name', 'value')
+    node_type = 'Assignment'
+    
     def __init__(self, name, value):
         self.name = name
         self.value = value
-        self.node_type = 'Assignment'
 
 
 class BinaryOp(ASTNode):
+    __slots__ = ('left', 'operator', 'right')
+    node_type = 'BinaryOp'
+    
     def __init__(self, left, operator, right):
         self.left = left
         self.operator = operator
         self.right = right
-        self.node_type = 'BinaryOp'
 
 
 class UnaryOp(ASTNode):
+    __slots__ = ('operator', 'operand')
+    node_type = 'UnaryOp'
+    
     def __init__(self, operator, operand):
         self.operator = operator
         self.operand = operand
-        self.node_type = 'UnaryOp'
 
 
 class IfExpr(ASTNode):
+    __slots__ = ('condition', 'then_branch', 'else_branch')
+    node_type = 'IfExpr'
+    
     def __init__(self, condition, then_branch, else_branch):
         self.condition = condition
         self.then_branch = then_branch
         self.else_branch = else_branch
-        self.node_type = 'IfExpr'
 
 
 class WhileLoop(ASTNode):
+    __slots__ = ('condition', 'body')
+    node_type = 'WhileLoop'
+    
     def __init__(self, condition, body):
         self.condition = condition
         self.body = body
-        self.node_type = 'WhileLoop'
 
 
 class ForLoop(ASTNode):
+    __slots__ = ('variable', 'iterable', 'body')
+    node_type = 'ForLoop'
+    
     def __init__(self, variable, iterable, body):
         self.variable = variable
         self.iterable = iterable
         self.body = body
-        self.node_type = 'ForLoop'
 
 
 class ReturnStmt(ASTNode):
+    __slots__ = ('value',)
+    node_type = 'ReturnStmt'
+    
     def __init__(self, value):
         self.value = value
-        self.node_type = 'ReturnStmt'
 
 
 class FunctionCall(ASTNode):
+    __slots__ = ('name', 'args')
+    node_type = 'FunctionCall'
+    
     def __init__(self, name, args):
         self.name = name
         self.args = args
-        self.node_type = 'FunctionCall'
 
 
 class Identifier(ASTNode):
+    __slots__ = ('name',)
+    node_type = 'Identifier'
+    
     def __init__(self, name):
         self.name = name
-        self.node_type = 'Identifier'
 
 
 class Number(ASTNode):
+    __slots__ = ('value',)
+    node_type = 'Number'
+    
     def __init__(self, value):
         self.value = int(value)
-        self.node_type = 'Number'
 
 
 class String(ASTNode):
+    __slots__ = ('value',)
+    node_type = 'String'
+    
     def __init__(self, value):
         self.value = value
-        self.node_type = 'String'
 
 
 class Boolean(ASTNode):
+    __slots__ = ('value',)
+    node_type = 'Boolean'
+    
     def __init__(self, value):
         self.value = value
-        self.node_type = 'Boolean'
 
 
 class MatchExpr(ASTNode):
+    __slots__ = ('expr', 'arms')
+    node_type = 'MatchExpr'
+    
     def __init__(self, expr, arms):
         self.expr = expr
         self.arms = arms  # List of (pattern, result) tuples
-        self.node_type = 'MatchExpr'
+
+
+# Binary operator precedence, loosest first; tokens not listed here end
+# an expression
+_PREC = {
+    TokenType.OR: 1,
+    TokenType.AND: 2,
+    TokenType.EQ: 3, TokenType.NEQ: 3,
+    TokenType.LT: 4, TokenType.GT: 4, TokenType.LTE: 4, TokenType.GTE: 4,
+    TokenType.PLUS: 5, TokenType.MINUS: 5,
+    TokenType.MULTIPLY: 6, TokenType.DIVIDE: 6, TokenType.MODULO: 6,
+}
+
+# Token types that start a unary expression / a match arm pattern
+_UNARY_OPS = frozenset({TokenType.MINUS, TokenType.NOT})
+_PATTERN_TOKENS = frozenset({TokenType.IDENTIFIER, TokenType.NUMBER, TokenType.STRING})
 
 
 class Parser:
@@ -409,15 +636,25 @@ class Parser:
     
     def __init__(self, lexer: Lexer):
         self.lexer = lexer
-        self.current_token = self.lexer.get_next_token()
+        # The whole token stream is lexed up front and walked by index,
+        # which also gives free lookahead (e.g. to tell `x = 1` from `x + 1`)
+        self.tokens = lexer.tokenize()
+        self.index = 0
+        self.current_token = self.tokens[0]
     
     def eat(self, token_type: TokenType):
         """Consume a token of the expected type."""
         if self.current_token.type == token_type:
-            self.current_token = self.lexer.get_next_token()
+            self.index += 1
+            self.current_token = self.tokens[self.index]
         else:
             raise Exception(f"Expected token {token_type.name}, got {self.current_token.type.name}")
     
+    def _advance(self):
+        """Consume the current token, whose type the caller has already checked."""
+        self.index += 1
+        self.current_token = self.tokens[self.index]
+    
     def parse_program(self):
         """Parse the entire program."""
         statements = []
@@ -429,39 +666,15 @@ class Parser:
     
     def parse_statement(self):
         """Parse a single statement."""
-        token_type = self.current_token.type
-        
-        if token_type == TokenType.FN:
-            return self.parse_function_def()
-        elif token_type == TokenType.LET:
-            return self.parse_variable_decl(mutable=False)
-        elif token_type == TokenType.VAR:
-            return self.parse_variable_decl(mutable=True)
-        elif token_type == TokenType.CONST:
-            return self.parse_constant_decl()
-        elif token_type == TokenType.IF:
-            return self.parse_if_expr()
-        elif token_type == TokenType.WHILE:
-            return self.parse_while_loop()
-        elif token_type == TokenType.FOR:
-            return self.parse_for_loop()
-        elif token_type == TokenType.RETURN:
-            return self.parse_return_stmt()
-        elif token_type == TokenType.MATCH:
-            return self.parse_match_expr()
-        elif token_type == TokenType.IDENTIFIER:
+        handler = _STATEMENT_DISPATCH[self.current_token.type]
+        if handler is not None:
+            return handler(self)
+        
+        if self.current_token.type == TokenType.IDENTIFIER:
             # Could be assignment or expression
             ident_name = self.current_token.value
-            next_pos = self.lexer.pos
-            next_char = self.lexer.current_char
-            next_token = self.lexer.get_next_token()  # Peek at next token
-            
-            # Restore position
-            self.lexer.pos = next_pos
-            self.lexer.current_char = next_char
-            self.current_token = Token(TokenType.IDENTIFIER, ident_name, self.lexer.line, self.lexer.column)
             
-            if next_token.type == TokenType.ASSIGN:
+            if self.tokens[self.index + 1].type == TokenType.ASSIGN:
                 # It's an assignment
                 self.eat(TokenType.IDENTIFIER)
                 self.eat(TokenType.ASSIGN)
@@ -469,17 +682,12 @@ class Parser:
                 if self.current_token.type == TokenType.SEMICOLON:
                     self.eat(TokenType.SEMICOLON)
                 return Assignment(ident_name, value)
-            else:
-                # It's an expression (could be function call)
-                expr = self.parse_expression()
-                if self.current_token.type == TokenType.SEMICOLON:
-                    self.eat(TokenType.SEMICOLON)
-                return expr
-        else:
-            expr = self.parse_expression()
-            if self.current_token.type == TokenType.SEMICOLON:
-                self.eat(TokenType.SEMICOLON)
-            return expr
+        
+        # It's an expression (could be function call)
+        expr = self.parse_expression()
+        if self.current_token.type == TokenType.SEMICOLON:
+            self.eat(TokenType.SEMICOLON)
+        return expr
     
     def parse_function_def(self):
         """Parse a function definition."""
@@ -550,6 +758,12 @@ class Parser:
         
         return VariableDecl(mutable, name, var_type, value)
     
+    def _parse_let_decl(self):
+        return self.parse_variable_decl(mutable=False)
+    
+    def _parse_var_decl(self):
+        return self.parse_variable_decl(mutable=True)
+    
     def parse_constant_decl(self):
         """Parse a constant declaration."""
         self.eat(TokenType.CONST)
@@ -649,12 +863,12 @@ class Parser:
         arms = []
         while self.current_token.type != TokenType.RBRACE:
             # Parse pattern (simplified - just identifiers or literals for now)
-            if self.current_token.type in [TokenType.IDENTIFIER, TokenType.NUMBER, TokenType.STRING]:
+            if self.current_token.type in _PATTERN_TOKENS:
                 pattern = self.parse_primary()
             else:
                 raise Exception(f"Invalid pattern in match at {self.current_token.line}:{self.current_token.column}")
             
-            self.eat(TokenType.ARROW)  # =>
+            self.eat(TokenType.FAT_ARROW)
             result = self.parse_expression()
             
             arms.append((pattern, result))
@@ -670,106 +884,25 @@ class Parser:
         
         return MatchExpr(expr, arms)
     
-    def parse_expression(self):
-        """Parse an expression with operator precedence."""
-        return self.parse_logical_or()
-    
-    def parse_logical_or(self):
-        """Parse logical OR expressions."""
-        left = self.parse_logical_and()
-        
-        while self.current_token.type == TokenType.OR:
-            op = self.current_token
-            self.eat(TokenType.OR)
-            right = self.parse_logical_and()
-            left = BinaryOp(left, op.value, right)
-        
-        return left
-    
-    def parse_logical_and(self):
-        """Parse logical AND expressions."""
-        left = self.parse_equality()
-        
-        while self.current_token.type == TokenType.AND:
-            op = self.current_token
-            self.eat(TokenType.AND)
-            right = self.parse_equality()
-            left = BinaryOp(left, op.value, right)
-        
-        return left
-    
-    def parse_equality(self):
-        """Parse equality expressions."""
-        left = self.parse_comparison()
-        
-        while self.current_token.type in [TokenType.EQ, TokenType.NEQ]:
-            op = self.current_token
-            if op.type == TokenType.EQ:
-                self.eat(TokenType.EQ)
-            else:
-                self.eat(TokenType.NEQ)
-            right = self.parse_comparison()
-            left = BinaryOp(left, op.value, right)
-        
-        return left
-    
-    def parse_comparison(self):
-        """Parse comparison expressions."""
-        left = self.parse_term()
-        
-        while self.current_token.type in [TokenType.LT, TokenType.GT, TokenType.LTE, TokenType.GTE]:
-            op = self.current_token
-            if op.type == TokenType.LT:
-                self.eat(TokenType.LT)
-            elif op.type == TokenType.GT:
-                self.eat(TokenType.GT)
-            elif op.type == TokenType.LTE:
-                self.eat(TokenType.LTE)
-            else:  # GTE
-                self.eat(TokenType.GTE)
-            right = self.parse_term()
-            left = BinaryOp(left, op.value, right)
-        
-        return left
-    
-    def parse_term(self):
-        """Parse addition and subtraction."""
-        left = self.parse_factor()
-        
-        while self.current_token.type in [TokenType.PLUS, TokenType.MINUS]:
-            op = self.current_token
-            if op.type == TokenType.PLUS:
-                self.eat(TokenType.PLUS)
-            else:  # MINUS
-                self.eat(TokenType.MINUS)
-            right = self.parse_factor()
-            left = BinaryOp(left, op.value, right)
-        
-        return left
-    
-    def parse_factor(self):
-        """Parse multiplication and division."""
+    def parse_expression(self, min_prec: int = 1):
+        """Parse a binary expression by precedence climbing over _PREC."""
         left = self.parse_unary()
         
-        while self.current_token.type in [TokenType.MULTIPLY, TokenType.DIVIDE]:
+        while True:
             op = self.current_token
-            if op.type == TokenType.MULTIPLY:
-                self.eat(TokenType.MULTIPLY)
-            else:  # DIVIDE
-                self.eat(TokenType.DIVIDE)
-            right = self.parse_unary()
+            prec = _PREC.get(op.type, 0)
+            if prec < min_prec:
+                return left
+            self._advance()
+            # Binding the right operand one level tighter keeps operators left-associative
+            right = self.parse_expression(prec + 1)
             left = BinaryOp(left, op.value, right)
-        
-        return left
     
     def parse_unary(self):
         """Parse unary operators."""
-        if self.current_token.type in [TokenType.MINUS, TokenType.NOT]:
+        if self.current_token.type in _UNARY_OPS:
             op = self.current_token
-            if op.type == TokenType.MINUS:
-                self.eat(TokenType.MINUS)
-            else:  # NOT
-                self.eat(TokenType.NOT)
+            self._advance()
             operand = self.parse_unary()
             return UnaryOp(op.value, operand)
         
@@ -798,23 +931,22 @@ class Parser:
         token = self.current_token
         
         if token.type == TokenType.NUMBER:
-            self.eat(TokenType.NUMBER)
+            self._advance()
             return Number(token.value)
         elif token.type == TokenType.STRING:
-            self.eat(TokenType.STRING)
+            self._advance()
             return String(token.value)
         elif token.type == TokenType.TRUE:
-            self.eat(TokenType.TRUE)
+            self._advance()
             return Boolean(True)
         elif token.type == TokenType.FALSE:
-            self.eat(TokenType.FALSE)
+            self._advance()
             return Boolean(False)
         elif token.type == TokenType.IDENTIFIER:
-            name = self.current_token.value
-            self.eat(TokenType.IDENTIFIER)
-            return Identifier(name)
+            self._advance()
+            return Identifier(token.value)
         elif token.type == TokenType.LPAREN:
-            self.eat(TokenType.LPAREN)
+            self._advance()
             expr = self.parse_expression()
             self.eat(TokenType.RPAREN)
             return expr
@@ -822,6 +954,24 @@ class Parser:
             raise Exception(f"Unexpected token: {token.type.name}")
 
 
+def _build_statement_dispatch():
+    """Map each token type that starts a keyword statement to its Parser method."""
+    table = [None] * len(TokenType)
+    table[TokenType.FN] = Parser.parse_function_def
+    table[TokenType.LET] = Parser._parse_let_decl
+    table[TokenType.VAR] = Parser._parse_var_decl
+    table[TokenType.CONST] = Parser.parse_constant_decl
+    table[TokenType.IF] = Parser.parse_if_expr
+    table[TokenType.WHILE] = Parser.parse_while_loop
+    table[TokenType.FOR] = Parser.parse_for_loop
+    table[TokenType.RETURN] = Parser.parse_return_stmt
+    table[TokenType.MATCH] = Parser.parse_match_expr
+    return table
+
+
+_STATEMENT_DISPATCH = _build_statement_dispatch()
+
+
 def main():
     """Main function for testing the parser."""
     print("Clarity Language Parser")
@@ -845,14 +995,7 @@ def main():
     print(sample_code)
     print("\nTokens:")
     
-    lexer = Lexer(sample_code)
-    tokens = []
-    while True:
-        token = lexer.get_next_token()
-        tokens.append(token)
-        print(token)
-        if token.type == TokenType.EOF:
-            break
+    print("\n".join(map(str, Lexer(sample_code))))
     
     print("\nParsing AST:")
     lexer = Lexer(sample_code)
@@ -864,48 +1007,87 @@ def main():
         print(f"Parse error: {e}")
 
 
-def print_ast(node, depth=0):
-    """Helper function to print the AST in a readable format."""
-    indent = "  " * depth
-    if isinstance(node, Program):
-        print(f"{indent}Program")
-        for stmt in node.statements:
-            print_ast(stmt, depth + 1)
-    elif isinstance(node, FunctionDef):
-        print(f"{indent}FunctionDef: {node.name}")
-        print(f"{indent}  Params: {node.params}")
-        print(f"{indent}  ReturnType: {node.return_type}")
-        print(f"{indent}  Body:")
-        for stmt in node.body:
-            print_ast(stmt, depth + 2)
-    elif isinstance(node, VariableDecl):
-        mut = "mut" if node.mutable else "let"
-        print(f"{indent}VariableDecl: {mut} {node.name}: {node.var_type} = ")
-        print_ast(node.value, depth + 1)
-    elif isinstance(node, BinaryOp):
-        print(f"{indent}BinaryOp: {node.operator}")
-        print_ast(node.left, depth + 1)
-        print_ast(node.right, depth + 1)
-    elif isinstance(node, Identifier):
-        print(f"{indent}Identifier: {node.name}")
-    elif isinstance(node, Number):
-        print(f"{indent}Number: {node.value}")
-    elif isinstance(node, String):
-        print(f"{indent}String: {node.value}")
-    elif isinstance(node, IfExpr):
-        print(f"{indent}IfExpr")
-        print(f"{indent}  Condition:")
-        print_ast(node.condition, depth + 1)
-        print(f"{indent}  Then:")
-        for stmt in node.then_branch:
-            print_ast(stmt, depth + 1)
-        if node.else_branch:
-            print(f"{indent}  Else:")
-            for stmt in node.else_branch:
-                print_ast(stmt, depth + 1)
-    else:
-        print(f"{indent}{node.node_type}: {getattr(node, 'name', getattr(node, 'value', 'Unknown'))}")
+def print_ast(node, depth=0, out=None):
+    """Helper function to print the AST in a readable format.
+
+    Lines are collected into out; the outermost call prints them all
+    with a single write.
+    """
+    if out is None:
+        out = []
+        print_ast(node, depth, out)
+        print("\n".join(out))
+        return
+    _AST_PRINTERS.get(type(node), _print_other)(node, "  " * depth, depth, out)
+
+
+def _print_program(node, indent, depth, out):
+    out.append(f"{indent}Program")
+    for stmt in node.statements:
+        print_ast(stmt, depth + 1, out)
+
+
+def _print_function_def(node, indent, depth, out):
+    out.append(f"{indent}FunctionDef: {node.name}")
+    out.append(f"{indent}  Params: {node.params}")
+    out.append(f"{indent}  ReturnType: {node.return_type}")
+    out.append(f"{indent}  Body:")
+    for stmt in node.body:
+        print_ast(stmt, depth + 2, out)
+
+
+def _print_variable_decl(node, indent, depth, out):
+    mut = "mut" if node.mutable else "let"
+    out.append(f"{indent}VariableDecl: {mut} {node.name}: {node.var_type} = ")
+    print_ast(node.value, depth + 1, out)
+
+
+def _print_binary_op(node, indent, depth, out):
+    out.append(f"{indent}BinaryOp: {node.operator}")
+    print_ast(node.left, depth + 1, out)
+    print_ast(node.right, depth + 1, out)
+
+
+def _print_identifier(node, indent, depth, out):
+    out.append(f"{indent}Identifier: {node.name}")
+
+
+def _print_number(node, indent, depth, out):
+    out.append(f"{indent}Number: {node.value}")
+
+
+def _print_string(node, indent, depth, out):
+    out.append(f"{indent}String: {node.value}")
+
+
+def _print_if_expr(node, indent, depth, out):
+    out.append(f"{indent}IfExpr")
+    out.append(f"{indent}  Condition:")
+    print_ast(node.condition, depth + 1, out)
+    out.append(f"{indent}  Then:")
+    for stmt in node.then_branch:
+        print_ast(stmt, depth + 1, out)
+    if node.else_branch:
+        out.append(f"{indent}  Else:")
+        for stmt in node.else_branch:
+            print_ast(stmt, depth + 1, out)
+
+
+def _print_other(node, indent, depth, out):
+    out.append(f"{indent}{node.node_type}: {getattr(node, 'name', getattr(node, 'value', 'Unknown'))}")
+
 
+# print_ast dispatches on the exact node class
+_AST_PRINTERS = {
+    Program: _print_program,
+    FunctionDef: _print_function_def,
+    VariableDecl: _print_variable_decl,
+    BinaryOp: _print_binary_op,
+    Identifier: _print_identifier,
+    Number: _print_number,
+    String: _print_string,
+    IfExpr: _print_if_expr,
+}
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
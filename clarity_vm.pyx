@@ -0,0 +1,246 @@
+# cython: language_level=3
+"""
+Compiled dispatch loop for the Clarity VM.
+
+This is ``clarity_interpreter.VM`` with ``execute`` compiled by Cython:
+opcodes are compared as C ints (letting the if/elif chain become a
+switch) and the stack, frame list and instruction pointer are typed, so
+the loop itself no longer runs Python bytecode. Values stay ordinary
+Python objects, since Clarity values may be ints, floats, strings or
+functions.
+
+Build it in place with::
+
+    python setup.py build_ext --inplace
+
+``run_file`` picks this module up when it is importable and falls back
+to the tree-walking Interpreter otherwise. The loop below is a copy of
+``VM.execute``; test_engines.py runs both, and the Interpreter, over the
+same programs, so rebuild and rerun it after changing either.
+"""
+
+import clarity_interpreter as _py
+from clarity_interpreter import (
+    Compiler, Environment, FunctionDef, _loop_scopes, _prepare_function,
+)
+
+
+cdef enum:
+    LOAD_CONST = 0
+    LOAD_NAME = 1
+    DEFINE_NAME = 2
+    STORE_NAME = 3
+    POP = 4
+    POP_INTO = 5
+    DUP = 6
+    JUMP = 7
+    JUMP_IF_FALSE = 8
+    BINOP_ADD = 9
+    BINOP_SUB = 10
+    BINOP_MUL = 11
+    BINOP_DIV = 12
+    BINOP_MOD = 13
+    BINOP_EQ = 14
+    BINOP_NEQ = 15
+    BINOP_LT = 16
+    BINOP_GT = 17
+    BINOP_LTE = 18
+    BINOP_GTE = 19
+    JUMP_IF_FALSE_OR_POP = 20
+    JUMP_IF_TRUE_OR_POP = 21
+    UNARY_NEG = 22
+    UNARY_NOT = 23
+    PUSH_SCOPE = 24
+    POP_SCOPE = 25
+    GET_ITER = 26
+    FOR_ITER = 27
+    MAKE_FUNCTION = 28
+    CALL = 29
+    RETURN = 30
+    MATCH_FAIL = 31
+    LOAD_LOCAL = 32
+    LOAD_AT = 33
+    STORE_AT = 34
+    CLEAR_SCOPE = 35
+    RUN_LOOP = 36
+    OPCODE_COUNT = 37
+
+
+# The enum must match clarity_interpreter's numbering. A stale build
+# refuses to import so run_file falls back to the Python VM.
+_OPCODE_NAMES = (
+    'LOAD_CONST', 'LOAD_NAME', 'DEFINE_NAME', 'STORE_NAME', 'POP', 'POP_INTO',
+    'DUP', 'JUMP', 'JUMP_IF_FALSE', 'BINOP_ADD', 'BINOP_SUB', 'BINOP_MUL',
+    'BINOP_DIV', 'BINOP_MOD', 'BINOP_EQ', 'BINOP_NEQ', 'BINOP_LT', 'BINOP_GT',
+    'BINOP_LTE', 'BINOP_GTE', 'JUMP_IF_FALSE_OR_POP', 'JUMP_IF_TRUE_OR_POP',
+    'UNARY_NEG', 'UNARY_NOT', 'PUSH_SCOPE', 'POP_SCOPE', 'GET_ITER', 'FOR_ITER',
+    'MAKE_FUNCTION', 'CALL', 'RETURN', 'MATCH_FAIL', 'LOAD_LOCAL', 'LOAD_AT',
+    'STORE_AT', 'CLEAR_SCOPE', 'RUN_LOOP',
+)
+if len(_OPCODE_NAMES) != OPCODE_COUNT or any(
+        getattr(_py, name, None) != value for value, name in enumerate(_OPCODE_NAMES)):
+    raise ImportError("clarity_vm is out of date with clarity_interpreter's opcodes")
+
+_EXHAUSTED = _py._EXHAUSTED
+
+
+class VM(_py.VM):
+    """``clarity_interpreter.VM`` with a Cython-compiled dispatch loop."""
+
+    def execute(self, list code, list consts):
+        """Run compiled code in the global environment."""
+        cdef list stack = []
+        cdef list frames = []
+        cdef Py_ssize_t ip = 0
+        cdef Py_ssize_t argc
+        cdef int op
+        cdef object arg, b, value, func, info, jit, item, iterable, compiled, args, scopes
+        cdef object env = self.global_env
+
+        while True:
+            op = code[ip]
+            arg = code[ip + 1]
+            ip += 2
+
+            if op == LOAD_LOCAL:
+                stack.append(env.vars[arg])
+            elif op == LOAD_CONST:
+                stack.append(consts[arg])
+            elif op == JUMP_IF_FALSE:
+                if not stack.pop():
+                    ip = arg
+            elif op == JUMP:
+                ip = arg
+            elif op == LOAD_AT:
+                stack.append(env.get_at(*arg))
+            elif op == LOAD_NAME:
+                stack.append(env.get(arg))
+            elif op == POP:
+                stack.pop()
+            elif op == POP_INTO:
+                value = stack.pop()
+                stack[-arg] = value
+            elif op == BINOP_ADD:
+                b = stack.pop()
+                stack[-1] = stack[-1] + b
+            elif op == BINOP_SUB:
+                b = stack.pop()
+                stack[-1] = stack[-1] - b
+            elif op == BINOP_MUL:
+                b = stack.pop()
+                stack[-1] = stack[-1] * b
+            elif op == BINOP_LT:
+                b = stack.pop()
+                stack[-1] = stack[-1] < b
+            elif op == BINOP_GT:
+                b = stack.pop()
+                stack[-1] = stack[-1] > b
+            elif op == BINOP_LTE:
+                b = stack.pop()
+                stack[-1] = stack[-1] <= b
+            elif op == BINOP_GTE:
+                b = stack.pop()
+                stack[-1] = stack[-1] >= b
+            elif op == BINOP_EQ:
+                b = stack.pop()
+                stack[-1] = stack[-1] == b
+            elif op == BINOP_NEQ:
+                b = stack.pop()
+                stack[-1] = stack[-1] != b
+            elif op == BINOP_DIV:
+                b = stack.pop()
+                if b == 0:
+                    raise ZeroDivisionError("Division by zero")
+                stack[-1] = stack[-1] / b
+            elif op == BINOP_MOD:
+                b = stack.pop()
+                stack[-1] = stack[-1] % b
+            elif op == JUMP_IF_FALSE_OR_POP:
+                if stack[-1]:
+                    stack.pop()
+                else:
+                    ip = arg
+            elif op == JUMP_IF_TRUE_OR_POP:
+                if stack[-1]:
+                    ip = arg
+                else:
+                    stack.pop()
+            elif op == UNARY_NEG:
+                stack[-1] = -stack[-1]
+            elif op == UNARY_NOT:
+                stack[-1] = not stack[-1]
+            elif op == DEFINE_NAME:
+                env.define(arg, stack[-1])
+            elif op == STORE_AT:
+                env.assign_at(arg[0], arg[1], stack[-1])
+            elif op == STORE_NAME:
+                env.assign(arg, stack[-1])
+            elif op == PUSH_SCOPE:
+                env = Environment(parent=env)
+            elif op == POP_SCOPE:
+                env = env.parent
+            elif op == CLEAR_SCOPE:
+                env.vars.clear()
+            elif op == CALL:
+                name, argc = arg
+                if argc:
+                    args = stack[-argc:]
+                    del stack[-argc:]
+                else:
+                    args = []
+                func = stack.pop()
+                if callable(func):
+                    stack.append(func(*args))
+                elif isinstance(func, FunctionDef):
+                    info = func._cache
+                    if argc != info.arity:
+                        raise ValueError(f"Function {name} expects {info.arity} arguments but got {argc}")
+                    jit = info.jit
+                    if jit is not None:
+                        stack.append(jit(*args))
+                        continue
+                    frames.append((code, consts, ip, env, len(stack)))
+                    env = Environment(parent=env)
+                    env.vars = dict(zip(info.param_names, args))
+                    compiled = info.code
+                    if compiled is None:
+                        compiled = info.code = Compiler().compile_function(func)
+                    code, consts = compiled
+                    ip = 0
+                else:
+                    raise NameError(f"{name} is not callable")
+            elif op == RETURN:
+                value = stack.pop()
+                if not frames:
+                    return value
+                code, consts, ip, env, base = frames.pop()
+                del stack[base:]
+                stack.append(value)
+            elif op == DUP:
+                stack.append(stack[-1])
+            elif op == GET_ITER:
+                iterable = stack[-1]
+                if not hasattr(iterable, '__iter__'):
+                    raise TypeError(f"Cannot iterate over {type(iterable)}")
+                stack[-1] = iter(iterable)
+            elif op == FOR_ITER:
+                item = next(stack[-1], _EXHAUSTED)
+                if item is _EXHAUSTED:
+                    stack.pop()
+                    ip = arg
+                else:
+                    stack.append(item)
+            elif op == MAKE_FUNCTION:
+                _prepare_function(arg)
+                env.define(arg.name, arg)
+                stack.append(None)
+            elif op == RUN_LOOP:
+                loop_fn, names, end = arg
+                scopes = _loop_scopes(env, names)
+                if scopes is not None:
+                    stack.append(loop_fn(*scopes))
+                    ip = end
+            elif op == MATCH_FAIL:
+                raise ValueError(f"No match found for value: {stack.pop()}")
+            else:
+                raise Exception(f'Unknown opcode {op}')
@@ -7,6 +7,18 @@ from enhanced_translator import ClarityToBOCTranslator, BOCtoClarityTranslator
 from clarity_parser import Lexer, Parser
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj):
+    """Pretty-print obj as JSON, using orjson's encoder when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2, default=str)
+
 
 def debug_structure():
     """Debug the structure of the returned result."""
@@ -33,12 +45,12 @@ def debug_structure():
     result = enhanced_translator.translate_with_provenance(ast, clarity_code)
     
     print("Full result structure:")
-    print(json.dumps(result, indent=2, default=str))
+    print(_dumps(result))
     print()
     
     print("BOC representation structure:")
     boc_repr = result['boc_representation']
-    print(json.dumps(boc_repr, indent=2, default=str))
+    print(_dumps(boc_repr))
 
 
 if __name__ == "__main__":
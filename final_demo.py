@@ -36,17 +36,21 @@ def main():
     enhanced_translator = ClarityToBOCTranslator()
     result = enhanced_translator.translate_with_provenance(ast, clarity_code)
     
+    boc_representation = result['boc_representation']
+    structured_knowledge = boc_representation['structured_knowledge']
+    provenance = structured_knowledge['provenance']
+    
     print("2. ENHANCED FEATURES IMPLEMENTED:")
     print("-" * 50)
-    print(f"[OK] Semantic preservation: {result['boc_representation']['structured_knowledge']['provenance']['semantic_equivalence_verified']}")
+    print(f"[OK] Semantic preservation: {provenance['semantic_equivalence_verified']}")
     print(f"[OK] Cryptographic proofs: {result['proof']['proof_hash'][:16]}...")
-    print(f"[OK] Trust boundary validation: {result['boc_representation']['structured_knowledge']['provenance']['trust_boundary_validation']['verification_passed']}")
-    print(f"[OK] Version compatibility tracking: {result['boc_representation']['versioning_info']['compatibility_matrix']['compatible_deep_versions']}")
+    print(f"[OK] Trust boundary validation: {provenance['trust_boundary_validation']['verification_passed']}")
+    print(f"[OK] Version compatibility tracking: {boc_representation['versioning_info']['compatibility_matrix']['compatible_deep_versions']}")
     print(f"[OK] Source mapping capability: {len(result['source_map'])} entries")
     print()
     
     # Extract key improvements that address ZhihuThinker2's concerns
-    boc_components = result['boc_representation']['structured_knowledge']['components']
+    boc_components = structured_knowledge['components']
     if boc_components:
         first_component = boc_components[0]
         if 'structured_knowledge' in first_component:
@@ -9,6 +9,56 @@ import sys
 from typing import List, Dict, Any, Optional
 
 
+_KEYWORDS = frozenset({'if', 'else', 'while', 'for', 'def', 'return'})
+
+# Two-character operators, keyed by the full lexeme
+_DOUBLE_CHAR_OPS = {
+    '==': 'EQ',
+    '!=': 'NEQ',
+    '<=': 'LTE',
+    '>=': 'GTE',
+    '&&': 'AND',
+    '||': 'OR',
+}
+
+# Brackets and separators are their own token type
+_PUNCTUATION = frozenset('(){}[],;:.')
+
+# Binary operators by precedence level
+_TERM_OPS = frozenset({'*', '/'})
+_EXPRESSION_OPS = frozenset({'+', '-'})
+
+# Character classes, by the token a character can start
+_ILLEGAL, _SPACE, _DIGIT, _IDENT_START, _QUOTE, _OPERATOR, _PUNCT = range(7)
+
+
+def _classify(char: str) -> int:
+    """Return the character class of a single character."""
+    if char.isspace():
+        return _SPACE
+    if char.isdigit():
+        return _DIGIT
+    if char.isalpha() or char == '_':
+        return _IDENT_START
+    if char in '"\'':
+        return _QUOTE
+    if char in '+-*/=<>!&|':
+        return _OPERATOR
+    if char in _PUNCTUATION:
+        return _PUNCT
+    return _ILLEGAL
+
+
+# ASCII characters are classified by table lookup; anything else goes
+# through _classify
+_ASCII_CLASS = [_classify(chr(code)) for code in range(128)]
+
+# Character-class runs, matched in one call instead of a loop per character
+_SPACE_RUN = re.compile(r'\s*')
+_DIGIT_RUN = re.compile(r'[0-9]*')
+_IDENT_RUN = re.compile(r'\w*')
+
+
 class Token:
     """Represents a lexical token in our language."""
     
@@ -53,42 +103,59 @@ class Lexer:
             return None
         return self.text[peek_pos]
     
+    def _skip_to(self, pos: int):
+        """Jump ahead to pos, updating line/column for the skipped text."""
+        text = self.text
+        newlines = text.count('\n', self.pos, pos)
+        if newlines:
+            self.line += newlines
+            self.column = pos - text.rfind('\n', self.pos, pos) - 1
+        else:
+            self.column += pos - self.pos
+        self.pos = pos
+        self.current_char = text[pos] if pos < len(text) else None
+    
     def skip_whitespace(self):
         """Skip over whitespace characters."""
-        while self.current_char is not None and self.current_char.isspace():
-            self.advance()
+        self._skip_to(_SPACE_RUN.match(self.text, self.pos).end())
     
     def read_number(self) -> str:
         """Read a number token."""
-        result = ''
-        while self.current_char is not None and self.current_char.isdigit():
-            result += self.current_char
-            self.advance()
-        return result
+        text = self.text
+        start = self.pos
+        pos = _DIGIT_RUN.match(text, start).end()
+        # Non-ASCII digits (str.isdigit, e.g. '²') take the slow path
+        end = len(text)
+        while pos < end and text[pos].isdigit():
+            pos += 1
+        self._skip_to(pos)
+        return text[start:pos]
     
     def read_identifier(self) -> str:
         """Read an identifier token."""
-        result = ''
-        while self.current_char is not None and (self.current_char.isalnum() or self.current_char == '_'):
-            result += self.current_char
-            self.advance()
-        return result
+        text = self.text
+        start = self.pos
+        pos = _IDENT_RUN.match(text, start).end()
+        self._skip_to(pos)
+        # Names repeat throughout a program; interning shares one string per name
+        return sys.intern(text[start:pos])
     
     def read_string(self) -> str:
         """Read a string literal."""
-        result = ''
         quote_char = self.current_char  # Store opening quote
         self.advance()  # Skip opening quote
         
+        # Escape sequences are kept as written, so the literal is a single
+        # slice of the source
+        start = end = self.pos
         while self.current_char is not None and self.current_char != quote_char:
             if self.current_char == '\\':  # Handle escape sequences
                 self.advance()
-                if self.current_char is not None:
-                    result += '\\' + self.current_char
-                    self.advance()
-            else:
-                result += self.current_char
-                self.advance()
+                if self.current_char is None:
+                    break  # A trailing backslash is dropped
+            self.advance()
+            end = self.pos
+        result = self.text[start:end]
         
         if self.current_char == quote_char:
             self.advance()  # Skip closing quote
@@ -98,67 +165,51 @@ class Lexer:
     def get_next_token(self) -> Token:
         """Get the next token from the input."""
         while self.current_char is not None:
-            if self.current_char.isspace():
+            code = ord(self.current_char)
+            kind = _ASCII_CLASS[code] if code < 128 else _classify(self.current_char)
+            
+            if kind == _SPACE:
                 self.skip_whitespace()
                 continue
             
-            if self.current_char.isdigit():
+            if kind == _DIGIT:
                 start_line, start_col = self.line, self.column
                 value = self.read_number()
                 return Token('NUMBER', value, start_line, start_col)
             
-            if self.current_char.isalpha() or self.current_char == '_':
+            if kind == _IDENT_START:
                 start_line, start_col = self.line, self.column
                 value = self.read_identifier()
                 
                 # Check if it's a keyword
-                if value in ['if', 'else', 'while', 'for', 'def', 'return']:
+                if value in _KEYWORDS:
                     return Token(value.upper(), value, start_line, start_col)
                 
                 return Token('IDENTIFIER', value, start_line, start_col)
             
-            if self.current_char in ['"', "'"]:
+            if kind == _QUOTE:
                 start_line, start_col = self.line, self.column
                 value = self.read_string()
                 return Token('STRING', value, start_line, start_col)
             
             # Single character tokens
-            if self.current_char in '+-*/=<>!&|':
+            if kind == _OPERATOR:
                 op = self.current_char
                 start_line, start_col = self.line, self.column
                 self.advance()
                 
                 # Check for double-character operators
-                if op == '=' and self.current_char == '=':
-                    self.advance()
-                    return Token('EQ', '==', start_line, start_col)
-                elif op == '!' and self.current_char == '=':
-                    self.advance()
-                    return Token('NEQ', '!=', start_line, start_col)
-                elif op == '<' and self.current_char == '=':
-                    self.advance()
-                    return Token('LTE', '<=', start_line, start_col)
-                elif op == '>' and self.current_char == '=':
-                    self.advance()
-                    return Token('GTE', '>=', start_line, start_col)
-                elif op == '&' and self.current_char == '&':
-                    self.advance()
-                    return Token('AND', '&&', start_line, start_col)
-                elif op == '|' and self.current_char == '|':
-                    self.advance()
-                    return Token('OR', '||', start_line, start_col)
+                if self.current_char is not None:
+                    lexeme = op + self.current_char
+                    double = _DOUBLE_CHAR_OPS.get(lexeme)
+                    if double is not None:
+                        self.advance()
+                        return Token(double, lexeme, start_line, start_col)
                 
                 return Token(op, op, start_line, start_col)
             
-            # Parentheses, braces, brackets
-            if self.current_char in '(){}[]':
-                char = self.current_char
-                start_line, start_col = self.line, self.column
-                self.advance()
-                return Token(char, char, start_line, start_col)
-            
-            # Other symbols
-            if self.current_char in ',;:.':
+            # Parentheses, braces, brackets and other symbols
+            if kind == _PUNCT:
                 char = self.current_char
                 start_line, start_col = self.line, self.column
                 self.advance()
@@ -168,6 +219,16 @@ class Lexer:
             raise Exception(f"Illegal character '{self.current_char}' at {self.line}:{self.column}")
         
         return Token('EOF', '', self.line, self.column)
+    
+    def tokenize(self) -> List[Token]:
+        """Lex the remaining input into a list of tokens ending with EOF."""
+        tokens = []
+        get_next_token = self.get_next_token
+        while True:
+            token = get_next_token()
+            tokens.append(token)
+            if token.type == 'EOF':
+                return tokens
 
 
 class Parser:
@@ -175,26 +236,35 @@ class Parser:
     
     def __init__(self, lexer: Lexer):
         self.lexer = lexer
-        self.current_token = self.lexer.get_next_token()
+        # Lex up front and walk the token list with an index
+        self.tokens = lexer.tokenize()
+        self.index = 0
+        self.current_token = self.tokens[0]
     
     def eat(self, token_type: str):
         """Consume a token of the expected type."""
         if self.current_token.type == token_type:
-            self.current_token = self.lexer.get_next_token()
+            self.index += 1
+            self.current_token = self.tokens[self.index]
         else:
             raise Exception(f"Expected token {token_type}, got {self.current_token.type}")
     
+    def _advance(self):
+        """Consume the current token, whose type the caller has already checked."""
+        self.index += 1
+        self.current_token = self.tokens[self.index]
+    
     def factor(self):
         """Parse a factor (numbers, variables, parenthesized expressions)."""
         token = self.current_token
         if token.type == 'NUMBER':
-            self.eat('NUMBER')
+            self._advance()
             return {'type': 'number', 'value': int(token.value)}
         elif token.type == 'IDENTIFIER':
-            self.eat('IDENTIFIER')
+            self._advance()
             return {'type': 'identifier', 'name': token.value}
         elif token.type == '(':
-            self.eat('(')
+            self._advance()
             result = self.expression()
             self.eat(')')
             return result
@@ -205,12 +275,9 @@ class Parser:
         """Parse a term (multiplication and division)."""
         node = self.factor()
         
-        while self.current_token.type in ['*', '/']:
+        while self.current_token.type in _TERM_OPS:
             op = self.current_token
-            if op.type == '*':
-                self.eat('*')
-            elif op.type == '/':
-                self.eat('/')
+            self._advance()
             
             node = {
                 'type': 'binary_op',
@@ -225,12 +292,9 @@ class Parser:
         """Parse an expression (addition and subtraction)."""
         node = self.term()
         
-        while self.current_token.type in ['+', '-']:
+        while self.current_token.type in _EXPRESSION_OPS:
             op = self.current_token
-            if op.type == '+':
-                self.eat('+')
-            elif op.type == '-':
-                self.eat('-')
+            self._advance()
             
             node = {
                 'type': 'binary_op',
@@ -254,14 +318,9 @@ def main():
     else:
         text = input("Enter expression: ")
     
-    lexer = Lexer(text)
-    
     print("Tokens:")
-    while True:
-        token = lexer.get_next_token()
+    for token in Lexer(text).tokenize():
         print(token)
-        if token.type == 'EOF':
-            break
     
     # Reset lexer to parse the expression
     lexer = Lexer(text)
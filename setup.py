@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Optional compiled build of the Clarity lexer and VM.
+
+    python setup.py build_ext --inplace
+
+compiles clarity_parser.py (with the Lexer and Parser typed by
+clarity_parser.pxd) and clarity_vm.pyx into extension modules next to
+their sources, which Python then imports in preference to the .py
+files. Without Cython nothing is built and the pure-Python modules are
+used as they are. After building, test_clarity.py, test_engines.py and
+the .clar samples run against the compiled modules.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        ['clarity_parser.py', 'clarity_vm.pyx'],
+        compiler_directives={'language_level': 3},
+    )
+
+setup(
+    name='clarity-language',
+    ext_modules=ext_modules,
+)
@@ -3,8 +3,26 @@
 Test script for the Clarity language parser.
 """
 
+import ast
+import os
+import traceback
+
 from clarity_parser import Lexer, Parser, print_ast
 
+# Code listings, token streams and AST dumps are only printed with
+# CLARITY_TEST_VERBOSE set; by default just headers and errors are
+VERBOSE = bool(os.environ.get("CLARITY_TEST_VERBOSE"))
+
+# (snippet label, tokens/AST produced or the exception raised) for every
+# snippet the tests run, for a harness to assert against
+RESULTS = []
+
+
+def _record(label, outcome):
+    RESULTS.append((label, outcome))
+    return outcome
+
+
 def test_basic_parsing():
     print("=== Testing Basic Parsing ===")
     
@@ -15,17 +33,13 @@ def test_basic_parsing():
     const MAX = 100;
     """
     
-    print("Code 1:")
-    print(code1)
-    print("\nTokens:")
-    lexer = Lexer(code1)
-    while True:
-        token = lexer.get_next_token()
-        print(token)
-        if token.type.name == 'EOF':
-            break
-    
-    print("\n" + "="*50)
+    tokens = _record("Code 1", Lexer(code1).tokenize())
+    if VERBOSE:
+        print("Code 1:")
+        print(code1)
+        print("\nTokens:")
+        print("\n".join(map(str, tokens)))
+        print("\n" + "="*50)
 
 
 def test_function_parsing():
@@ -42,21 +56,23 @@ def test_function_parsing():
     }
     """
     
-    print("Code 2:")
-    print(code2)
-    
-    print("\nParsing AST:")
+    if VERBOSE:
+        print("Code 2:")
+        print(code2)
+        print("\nParsing AST:")
     lexer = Lexer(code2)
     parser = Parser(lexer)
     try:
-        ast = parser.parse_program()
-        print_ast(ast, 0)
+        ast = _record("Code 2", parser.parse_program())
+        if VERBOSE:
+            print_ast(ast, 0)
     except Exception as e:
+        _record("Code 2", e)
         print(f"Parse error: {e}")
-        import traceback
         traceback.print_exc()
     
-    print("\n" + "="*50)
+    if VERBOSE:
+        print("\n" + "="*50)
 
 
 def test_control_flow():
@@ -81,24 +97,27 @@ def test_control_flow():
     }
     """
     
-    print("Code 3:")
-    print(code3)
-    
-    print("\nParsing AST:")
+    if VERBOSE:
+        print("Code 3:")
+        print(code3)
+        print("\nParsing AST:")
     lexer = Lexer(code3)
     parser = Parser(lexer)
     try:
-        ast = parser.parse_program()
-        # Just print the top-level structure to avoid too much output
-        print(f"Program has {len(ast.statements)} top-level statements")
-        for i, stmt in enumerate(ast.statements):
-            print(f"  Statement {i+1}: {stmt.node_type} - {getattr(stmt, 'name', 'unnamed')}")
+        ast = _record("Code 3", parser.parse_program())
+        if VERBOSE:
+            # Just print the top-level structure to avoid too much output
+            statements = ast.statements
+            print(f"Program has {len(statements)} top-level statements")
+            for number, stmt in enumerate(statements, 1):
+                print(f"  Statement {number}: {stmt.node_type} - {getattr(stmt, 'name', 'unnamed')}")
     except Exception as e:
+        _record("Code 3", e)
         print(f"Parse error: {e}")
-        import traceback
         traceback.print_exc()
     
-    print("\n" + "="*50)
+    if VERBOSE:
+        print("\n" + "="*50)
 
 
 def test_expressions():
@@ -113,20 +132,49 @@ def test_expressions():
     ]
     
     for expr in expressions:
-        print(f"\nExpression: {expr}")
         lexer = Lexer(expr)
         parser = Parser(lexer)
         try:
-            ast = parser.parse_expression()
-            print(f"Parsed as: {ast.node_type}")
+            ast = _record(expr, parser.parse_expression())
+            if VERBOSE:
+                print(f"\nExpression: {expr}")
+                print(f"Parsed as: {ast.node_type}")
         except Exception as e:
+            _record(expr, e)
+            print(f"\nExpression: {expr}")
             print(f"Parse error: {e}")
 
 
+def test_unused_imports():
+    print("=== Testing Parser Imports ===")
+    
+    # Names bound by import statements in clarity_parser.py that the module
+    # never reads; star imports bind nothing checkable
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "clarity_parser.py")
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    
+    imported = {}
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                if alias.name != "*":
+                    imported[alias.asname or alias.name.split(".")[0]] = node.lineno
+    used = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+    
+    unused = sorted(name for name in imported if name not in used)
+    for name in unused:
+        print(f"Unused import: {name} (clarity_parser.py line {imported[name]})")
+    assert not unused, f"clarity_parser.py imports unused names: {', '.join(unused)}"
+
+
 if __name__ == "__main__":
     test_basic_parsing()
     test_function_parsing()
     test_control_flow()
     test_expressions()
+    test_unused_imports()
     
+    failures = [label for label, outcome in RESULTS if isinstance(outcome, Exception)]
+    print(f"\n{len(RESULTS)} snippets, {len(failures)} failed")
     print("\n=== All tests completed ===")
\ No newline at end of file
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Differential test for the Clarity execution engines.
+
+Every program in the corpus runs on the tree-walking Interpreter with
+code generation switched off, which is the reference, and then on the
+Interpreter, the bytecode VM and, when it has been built, the compiled
+clarity_vm.VM. Each engine has to print the same output and return the
+same value, or raise the same exception type with the same message.
+Calling Interpreter.visit() directly on an unresolved tree is held to
+the same results.
+"""
+
+import contextlib
+import io
+
+import clarity_interpreter
+from clarity_interpreter import Interpreter, VM
+from clarity_parser import Lexer, Parser
+
+try:
+    from clarity_vm import VM as CompiledVM
+except ImportError:
+    CompiledVM = None
+
+ENGINES = [('Interpreter', Interpreter), ('VM', VM)]
+if CompiledVM is not None:
+    ENGINES.append(('clarity_vm.VM', CompiledVM))
+
+CASES = [
+    ("nested return", """
+    fn f(n: Int) -> Int {
+        if n > 0 {
+            while true {
+                if n > 2 { return n * 10; }
+                return n;
+            }
+        }
+        return -1;
+    }
+    println(f(5), f(1), f(0));
+    f(3);
+    """),
+    ("return from a for loop", """
+    fn first_over(limit: Int) {
+        for i in range(100) {
+            if i * i > limit { return i; }
+        }
+        return -1;
+    }
+    first_over(50);
+    """),
+    ("top-level return", "let a = 1; if a > 0 { return 5; } 9;"),
+    ("short-circuit", """
+    fn boom() -> Bool { println("boom"); return true; }
+    let a = false && boom();
+    let b = true || boom();
+    let c = true && boom();
+    println(a, b, c);
+    a || 0;
+    """),
+    ("dynamic-scope call", """
+    fn show() { return x; }
+    fn caller() { let x = 7; return show(); }
+    caller();
+    """),
+    ("block scope", "var x = 1; if true { let x = 2; x = 3; } x;"),
+    ("for over range", """
+    var s = 0;
+    for i in range(10) {
+        if i % 2 == 0 { s = s + i; }
+    }
+    s;
+    """),
+    ("for over a non-iterable", "for i in 5 { println(i); }"),
+    ("while loop", "var i = 0; var s = 0; while i < 10 { s = s + i; i = i + 1; } println(s); i;"),
+    ("while loop with unary and logical operators", """
+    var i = 0;
+    var n = 0;
+    while !(i >= 6) && (n > -100 || false) {
+        n = n - i % 4;
+        i = i + 1;
+    }
+    n / 2;
+    """),
+    ("while loop with a call", "var i = 0; while i < 3 { println(i); i = i + 1; }"),
+    ("while loop over an unbound name", "var i = 0; while i < 3 { i = i + step; }"),
+    ("match", 'let v = 2; match v { 1 => "one", 2 => "two", other => "many" }'),
+    ("match catch-all", 'let v = 9; match v { 1 => "one", other => "many" }'),
+    ("no match", 'let v = 5; match v { 1 => "one", 2 => "two" }'),
+    ("arity error", "fn f(a: Int, b: Int) -> Int { return a + b; } f(1);"),
+    ("division by zero", "let a = 1; let b = 0; a / b;"),
+    ("division by zero in a JIT'd function", """
+    fn d(a: Int, b: Int) -> Int { return a / b; }
+    d(1, 0);
+    """),
+    ("undefined variable", "y + 1;"),
+    ("calling a non-function", "let z = 3; z(1);"),
+    ("JIT'd recursion", """
+    fn fib(n: Int) -> Int {
+        if n < 2 { return n; }
+        return fib(n - 1) + fib(n - 2);
+    }
+    fib(15);
+    """),
+    ("JIT'd arithmetic and logic", """
+    fn f(a: Int, b: Int) -> Int {
+        var acc = 0;
+        var i = 0;
+        while i < a {
+            if !(i % 3 == 0) && (i > 1 || b < 0) {
+                acc = acc + i * b;
+            } else {
+                acc = acc - 1;
+            }
+            i = i + 1;
+        }
+        return -acc / 2;
+    }
+    println(f(10, 3), f(4, -1));
+    f(7, 2);
+    """),
+    ("non-JIT'd recursion", """
+    fn fib(n: Int, tag: String) -> Int {
+        if n < 2 { return n; }
+        return fib(n - 1, tag) + fib(n - 2, tag);
+    }
+    fib(12, "x");
+    """),
+    ("function value is its last statement", """
+    fn g(n: Int) -> Int {
+        let k = n * 2;
+        if k > 3 { k } else { 0 }
+    }
+    println(g(2), g(1));
+    """),
+    ("let chain", "let x = 5; let y = x + 2;"),
+    ("function declared inside a function", """
+    fn outer(n: Int) -> Int {
+        fn inner(x: Int) -> Int { return x + 1; }
+        return inner(n) * 2;
+    }
+    var s = 0;
+    for i in range(5) { s = s + outer(i); }
+    s;
+    """),
+]
+
+
+@contextlib.contextmanager
+def _without_codegen():
+    """Run with the function JIT and while-loop code generation disabled."""
+    saved = clarity_interpreter._try_jit, clarity_interpreter._compile_loop
+    clarity_interpreter._try_jit = lambda func_def: None
+    clarity_interpreter._compile_loop = lambda node: None
+    try:
+        yield
+    finally:
+        clarity_interpreter._try_jit, clarity_interpreter._compile_loop = saved
+
+
+def run(engine_class, source, direct=False):
+    """Run source on a fresh engine, returning (outcome, printed output).
+
+    With direct=True the tree goes straight to visit(), skipping the
+    Resolver that interpret() runs first.
+    """
+    # Engines cache per-node data on the AST, so each run parses afresh
+    ast = Parser(Lexer(source)).parse_program()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            engine = engine_class()
+            result = engine.visit(ast) if direct else engine.interpret(ast)
+            outcome = ('result', result)
+        except Exception as e:
+            outcome = ('error', type(e).__name__, str(e))
+    return outcome, output.getvalue()
+
+
+def test_engines_agree():
+    print("=== Testing Engine Agreement ===")
+    print("Engines: " + ", ".join(name for name, _ in ENGINES))
+
+    mismatches = []
+    for name, source in CASES:
+        with _without_codegen():
+            expected = run(Interpreter, source)
+        for engine_name, engine_class in ENGINES:
+            actual = run(engine_class, source)
+            if actual != expected:
+                mismatches.append((name, engine_name, expected, actual))
+        actual = run(Interpreter, source, direct=True)
+        if actual != expected:
+            mismatches.append((name, 'Interpreter.visit', expected, actual))
+        print(f"  {name}: {expected[0]}")
+
+    for name, engine_name, expected, actual in mismatches:
+        print(f"MISMATCH in {name!r} on {engine_name}:")
+        print(f"  expected {expected!r}")
+        print(f"  got      {actual!r}")
+    assert not mismatches, f"{len(mismatches)} engine mismatches"
+    return mismatches
+
+
+if __name__ == "__main__":
+    test_engines_agree()
+
+    print("\n=== All tests completed ===")
@@ -42,9 +42,10 @@ def test_semantic_preservation():
     enhanced_translator = ClarityToBOCTranslator()
     result = enhanced_translator.translate_with_provenance(ast, clarity_code)
     
+    provenance = result['boc_representation']['structured_knowledge']['provenance']
     print(f"✓ Translation proof generated: {result['proof']['proof_hash'][:16]}...")
-    print(f"✓ Semantic preservation verified: {result['boc_representation']['structured_knowledge']['provenance']['semantic_equivalence_verified']}")
-    print(f"✓ Trust boundary validation: {result['boc_representation']['structured_knowledge']['provenance']['trust_boundary_validation']['verification_passed']}")
+    print(f"✓ Semantic preservation verified: {provenance['semantic_equivalence_verified']}")
+    print(f"✓ Trust boundary validation: {provenance['trust_boundary_validation']['verification_passed']}")
     print()
 
 
@@ -232,27 +233,31 @@ def test_end_to_end_scenario():
     enhanced_translator = ClarityToBOCTranslator()
     result = enhanced_translator.translate_with_provenance(ast, clarity_code)
     
+    boc_representation = result['boc_representation']
+    structured_knowledge = boc_representation['structured_knowledge']
+    provenance = structured_knowledge['provenance']
     print("TRANSLATION RESULTS:")
-    print(f"✓ Semantic preservation: {result['boc_representation']['structured_knowledge']['provenance']['semantic_equivalence_verified']}")
+    print(f"✓ Semantic preservation: {provenance['semantic_equivalence_verified']}")
     print(f"✓ Source maps generated: {len(result['source_map'])} entries")
-    print(f"✓ Version compatibility: {result['boc_representation']['versioning_info']['compatibility_matrix']['compatible_deep_versions']}")
-    print(f"✓ Trust boundary validated: {result['boc_representation']['structured_knowledge']['provenance']['trust_boundary_validation']['verification_passed']}")
+    print(f"✓ Version compatibility: {boc_representation['versioning_info']['compatibility_matrix']['compatible_deep_versions']}")
+    print(f"✓ Trust boundary validated: {provenance['trust_boundary_validation']['verification_passed']}")
     print()
     
     # Perform round-trip verification
     reverse_translator = BOCtoClarityTranslator()
     roundtrip_result = reverse_translator.translate_with_verification(
-        result['boc_representation'],
+        boc_representation,
         result['proof']
     )
     
+    verification_result = roundtrip_result['verification_result']
     print("ROUND-TRIP VERIFICATION:")
-    print(f"✓ Verification passed: {roundtrip_result['verification_result']['verification_passed']}")
-    print(f"✓ Confidence level: {roundtrip_result['verification_result']['confidence_level']}")
+    print(f"✓ Verification passed: {verification_result['verification_passed']}")
+    print(f"✓ Confidence level: {verification_result['confidence_level']}")
     print()
     
     # Show debugging capability
-    components = result['boc_representation']['structured_knowledge']['components']
+    components = structured_knowledge['components']
     if components:
         first_func = components[0] if 'structured_knowledge' in components[0] else components[1] if len(components) > 1 else None
         if first_func and 'reasoning_context' in first_func:
@@ -8,12 +8,25 @@ Addresses ZhihuThinker2's concerns about:
 - Trust boundary validation
 """
 
+import functools
 import hashlib
 import json
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 
 
+# Canonical JSON for hashing BOC targets; one encoder instance instead of
+# a fresh one per json.dumps call. The output must stay byte-for-byte
+# stable, or existing proofs stop verifying.
+_CANONICAL_JSON = json.JSONEncoder(sort_keys=True)
+
+
+@functools.lru_cache(maxsize=128)
+def _sha256_hex(text: str) -> str:
+    """SHA-256 hex digest of text; retranslating a program reuses its hash."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
 class TranslationProof:
     """Cryptographic proof of semantic equivalence between Clarity and BOC representations."""
     
@@ -22,23 +35,29 @@ class TranslationProof:
         self.boc_target = boc_target
         self.translator_version = translator_version
         self.timestamp = datetime.now().isoformat()
-        self.source_hash = hashlib.sha256(clarity_source.encode()).hexdigest()
-        self.target_hash = hashlib.sha256(json.dumps(boc_target, sort_keys=True).encode()).hexdigest()
+        self.source_hash = _sha256_hex(clarity_source)
+        self.target_hash = hashlib.sha256(_CANONICAL_JSON.encode(boc_target).encode()).hexdigest()
         self.proof_hash = self._generate_proof_hash()
     
     def _generate_proof_hash(self) -> str:
         """Generate a cryptographic hash proving the relationship between source and target."""
-        proof_data = f"{self.source_hash}{self.target_hash}{self.translator_version}{self.timestamp}"
-        return hashlib.sha256(proof_data.encode()).hexdigest()
+        return self._hash_components(self.source_hash, self.target_hash)
+    
+    def _hash_components(self, source_hash: str, target_hash: str) -> str:
+        """Hash the proof components in order without joining them into one string first."""
+        proof = hashlib.sha256(source_hash.encode())
+        proof.update(target_hash.encode())
+        proof.update(self.translator_version.encode())
+        proof.update(self.timestamp.encode())
+        return proof.hexdigest()
     
     def verify_proof(self, clarity_source: str, boc_target: Dict) -> bool:
         """Verify that the proof is valid for the given source and target."""
-        computed_source_hash = hashlib.sha256(clarity_source.encode()).hexdigest()
-        computed_target_hash = hashlib.sha256(json.dumps(boc_target, sort_keys=True).encode()).hexdigest()
+        computed_source_hash = _sha256_hex(clarity_source)
+        computed_target_hash = hashlib.sha256(_CANONICAL_JSON.encode(boc_target).encode()).hexdigest()
         
         # Recompute the proof hash
-        proof_data = f"{computed_source_hash}{computed_target_hash}{self.translator_version}{self.timestamp}"
-        computed_proof_hash = hashlib.sha256(proof_data.encode()).hexdigest()
+        computed_proof_hash = self._hash_components(computed_source_hash, computed_target_hash)
         
         return computed_proof_hash == self.proof_hash and computed_source_hash == self.source_hash
 
@@ -92,14 +111,14 @@ class ClarityToBOCTranslator:
         return {
             "boc_representation": boc_representation,
             "proof": proof.__dict__.copy(),
-            "source_map": {k: v for k, v in source_map.clarity_to_boc.items()},  # Convert to dict for serialization
+            "source_map": dict(source_map.clarity_to_boc),  # Copy for serialization
             "translator_version": self.version,
             "timestamp": datetime.now().isoformat()
         }
     
     def _generate_program_id(self, clarity_source: str) -> str:
         """Generate a unique ID for the program based on its content."""
-        return hashlib.sha256(clarity_source.encode()).hexdigest()[:16]
+        return _sha256_hex(clarity_source)[:16]
     
     def _generate_source_map(self, clarity_ast, boc_representation) -> SourceMap:
         """Generate a source map for debugging across layers."""